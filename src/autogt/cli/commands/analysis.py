@@ -128,7 +128,7 @@ def create(
                 click.echo(f"Processing time: {result.total_execution_time_seconds:.2f}s")
                 click.echo(f"Steps completed: {len(result.steps_completed)}/8")
                 
-                if result.final_status == CompletionStatus.COMPLETED:
+                if result.final_status is CompletionStatus.COMPLETED:
                     click.echo("✅ Analysis completed successfully")
                 else:
                     click.echo(f"⚠️  Analysis status: {result.final_status.value}")
@@ -235,6 +235,17 @@ def list(
                 click.echo("No analyses found matching the criteria.")
                 return
             
+            # Progress of in-progress analyses is derived from their entity tree;
+            # load the trees for all of them in one batch instead of lazily per row
+            in_progress_ids = [
+                analysis.id for analysis in analyses
+                if analysis.completion_status is CompletionStatus.IN_PROGRESS
+            ]
+            if in_progress_ids:
+                session.query(TaraAnalysis).options(*TaraAnalysis.report_load_options()).filter(
+                    TaraAnalysis.id.in_(in_progress_ids)
+                ).all()
+            
             # Prepare output data
             output_data = []
             for analysis in analyses:
@@ -245,8 +256,8 @@ def list(
                     "status": analysis.completion_status.value.lower().replace('_', ' '),
                     "phase": analysis.analysis_phase.value.lower(),
                     "progress": f"{_calculate_progress_percentage(analysis)}%",
-                    "created": analysis.created_at.strftime("%Y-%m-%d %H:%M"),
-                    "completed": analysis.completed_at.strftime("%Y-%m-%d %H:%M") if analysis.completed_at else "-"
+                    "created": _format_timestamp(analysis.created_at),
+                    "completed": _format_timestamp(analysis.completed_at)
                 })
             
             # Format and display output
@@ -349,56 +360,52 @@ def _create_empty_analysis(
         return str(analysis.id)
 
 
+def _format_timestamp(value: Optional[datetime]) -> str:
+    """Format a timestamp as 'YYYY-MM-DD HH:MM' for listings ('-' if unset)."""
+    if value is None:
+        return "-"
+    # isoformat avoids re-parsing a strftime format per row; slicing drops any UTC offset
+    return value.isoformat(sep=" ", timespec="minutes")[:16]
+
+
 def _calculate_progress_percentage(analysis: TaraAnalysis) -> int:
     """Calculate progress percentage for analysis."""
-    if analysis.completion_status == CompletionStatus.COMPLETED:
-        return 100
-    elif analysis.completion_status == CompletionStatus.FAILED:
-        return 0
-    
-    # Simple progress based on current step
-    current_step = analysis.get_current_step()
-    if not current_step:
-        return 0
-    
-    # Map steps to progress percentages
-    step_progress = {
-        "asset_identification": 12,
-        "threat_scenario_identification": 25,
-        "attack_path_analysis": 37,
-        "attack_feasibility_rating": 50,
-        "impact_rating": 62,
-        "risk_value_determination": 75,
-        "risk_treatment_decision": 87,
-        "cybersecurity_goals": 100
-    }
-    
-    return step_progress.get(current_step, 0)
+    return analysis.get_progress_percentage()
 
 
 def _get_detailed_analysis_info(db_service: DatabaseService, analysis_id: str) -> Dict[str, Any]:
     """Get detailed analysis information."""
     with db_service.get_session() as session:
-        from sqlalchemy.orm import selectinload
-        from ...models import TaraAnalysis
+        from sqlalchemy import func, select
+        from ...models import Asset, ThreatScenario, RiskValue, CybersecurityGoal
         
-        analysis = session.query(TaraAnalysis).options(
-            selectinload(TaraAnalysis.assets),
-            selectinload(TaraAnalysis.cybersecurity_goals)
+        # Count every element in one statement; the scalar subqueries correlate
+        # to the selected analysis, so no related rows are loaded into Python
+        counts = session.query(
+            select(func.count(Asset.id))
+            .where(Asset.analysis_id == TaraAnalysis.id)
+            .scalar_subquery(),
+            select(func.count(ThreatScenario.id))
+            .join(Asset, ThreatScenario.asset_id == Asset.id)
+            .where(Asset.analysis_id == TaraAnalysis.id)
+            .scalar_subquery(),
+            select(func.count(RiskValue.id))
+            .join(ThreatScenario, RiskValue.threat_scenario_id == ThreatScenario.id)
+            .join(Asset, ThreatScenario.asset_id == Asset.id)
+            .where(Asset.analysis_id == TaraAnalysis.id)
+            .scalar_subquery(),
+            select(func.count(CybersecurityGoal.id))
+            .where(CybersecurityGoal.analysis_id == TaraAnalysis.id)
+            .scalar_subquery(),
         ).filter(TaraAnalysis.id == analysis_id).first()
         
-        if not analysis:
+        if not counts:
             return {"error": "Analysis not found"}
         
-        # Count various elements
-        total_assets = len(analysis.assets)
-        total_threats = sum(len(asset.threat_scenarios) for asset in analysis.assets)
-        total_risks = sum(
-            len(threat.risk_values)
-            for asset in analysis.assets
-            for threat in asset.threat_scenarios
-        )
-        total_goals = len(analysis.cybersecurity_goals)
+        total_assets, total_threats, total_risks, total_goals = counts
+        
+        # Only the first few assets are shown
+        assets = session.query(Asset).filter(Asset.analysis_id == analysis_id).limit(5).all()
         
         return {
             "asset_count": total_assets,
@@ -411,7 +418,7 @@ def _get_detailed_analysis_info(db_service: DatabaseService, analysis_id: str) -
                     "type": asset.asset_type.value,
                     "criticality": asset.criticality_level.value
                 }
-                for asset in analysis.assets[:5]  # Show first 5 assets
+                for asset in assets
             ],
             "high_risks": []  # Would need to calculate from risk values
         }
\ No newline at end of file
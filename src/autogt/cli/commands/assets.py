@@ -9,9 +9,9 @@ import logging
 import csv
 import json
 from typing import Optional, Dict, Any
-from uuid import UUID
 
 from ...lib.exceptions import AutoGTError
+from ..utils import resolve_analysis_id
 from ...services.database import DatabaseService
 from ...models.asset import Asset, AssetType, CriticalityLevel
 from ...models.analysis import TaraAnalysis
@@ -87,7 +87,7 @@ def _interactive_asset_definition(ctx: click.Context, analysis_id: str) -> None:
         
         # Verify analysis exists
         with db_service.get_session() as session:
-            resolved_id = _resolve_analysis_id(session, analysis_id)
+            resolved_id = resolve_analysis_id(session, analysis_id)
             analysis = session.query(TaraAnalysis).filter(
                 TaraAnalysis.id == resolved_id
             ).first()
@@ -191,7 +191,7 @@ def _load_assets_from_file(ctx: click.Context, analysis_id: str, file_path: str)
         
         # Verify analysis exists
         with db_service.get_session() as session:
-            resolved_id = _resolve_analysis_id(session, analysis_id)
+            resolved_id = resolve_analysis_id(session, analysis_id)
             analysis = session.query(TaraAnalysis).filter(
                 TaraAnalysis.id == resolved_id
             ).first()
@@ -212,26 +212,28 @@ def _load_assets_from_file(ctx: click.Context, analysis_id: str, file_path: str)
             else:
                 raise AutoGTError(f"Unsupported file format: {file_extension}. Supported: csv, json")
             
-            # Process and save assets
-            assets_added = 0
+            # Names already in the analysis, fetched once; names staged below are
+            # added so duplicates within the file are caught as well
+            existing_names = {
+                name for (name,) in session.query(Asset.name).filter(Asset.analysis_id == resolved_id)
+            }
+            
+            # Process assets, collecting valid rows for a single batched insert
+            asset_rows = []
             assets_skipped = 0
             
             for asset_data in assets_data:
                 try:
-                    # Validate required fields
-                    if not asset_data.get('name'):
+                    # Validate required fields; names are compared and stored stripped
+                    name = (asset_data.get('name') or '').strip()
+                    if not name:
                         click.echo(f"⚠️  Skipping asset without name")
                         assets_skipped += 1
                         continue
                     
                     # Check if asset already exists
-                    existing = session.query(Asset).filter(
-                        Asset.analysis_id == resolved_id,
-                        Asset.name == asset_data['name']
-                    ).first()
-                    
-                    if existing:
-                        click.echo(f"⚠️  Asset '{asset_data['name']}' already exists, skipping")
+                    if name in existing_names:
+                        click.echo(f"⚠️  Asset '{name}' already exists, skipping")
                         assets_skipped += 1
                         continue
                     
@@ -240,41 +242,40 @@ def _load_assets_from_file(ctx: click.Context, analysis_id: str, file_path: str)
                         asset_type = AssetType(asset_data.get('type', 'HARDWARE').upper())
                     except ValueError:
                         asset_type = AssetType.HARDWARE
-                        click.echo(f"⚠️  Invalid asset type for '{asset_data['name']}', using HARDWARE")
+                        click.echo(f"⚠️  Invalid asset type for '{name}', using HARDWARE")
                     
                     # Parse criticality
                     try:
                         criticality = CriticalityLevel(asset_data.get('criticality', 'MEDIUM').upper())
                     except ValueError:
                         criticality = CriticalityLevel.MEDIUM
-                        click.echo(f"⚠️  Invalid criticality for '{asset_data['name']}', using MEDIUM")
+                        click.echo(f"⚠️  Invalid criticality for '{name}', using MEDIUM")
                     
-                    # Create asset
-                    asset = Asset(
-                        name=asset_data['name'].strip(),
-                        asset_type=asset_type,
-                        criticality_level=criticality,
-                        interfaces=asset_data.get('interfaces', []),
-                        data_flows=asset_data.get('data_flows', []),
-                        security_properties=asset_data.get('security_properties', {
+                    # Stage asset row
+                    asset_rows.append({
+                        "name": name,
+                        "asset_type": asset_type,
+                        "criticality_level": criticality,
+                        "interfaces": asset_data.get('interfaces', []),
+                        "data_flows": asset_data.get('data_flows', []),
+                        "security_properties": asset_data.get('security_properties', {
                             'description': asset_data.get('description', '')
                         }),
-                        iso_section=asset_data.get('iso_section', '21434-15.6'),
-                        analysis_id=resolved_id
-                    )
-                    
-                    # Save asset
-                    session.add(asset)
-                    assets_added += 1
-                    click.echo(f"✅ Asset '{asset_data['name']}' added successfully")
+                        "iso_section": asset_data.get('iso_section', '21434-15.6'),
+                        "analysis_id": resolved_id,
+                    })
+                    existing_names.add(name)
+                    click.echo(f"✅ Asset '{name}' added successfully")
                     
                 except Exception as e:
                     click.echo(f"❌ Error processing asset '{asset_data.get('name', 'unknown')}': {e}")
                     assets_skipped += 1
                     continue
             
-            # Commit all changes
+            # Save all assets in one batched INSERT and commit
+            session.bulk_insert_mappings(Asset, asset_rows)
             session.commit()
+            assets_added = len(asset_rows)
             
             # Summary
             click.echo(f"\n🎉 Asset loading completed!")
@@ -332,36 +333,6 @@ def _load_csv_assets(file_path: str) -> list:
     return assets
 
 
-def _resolve_analysis_id(session, analysis_id: str) -> UUID:
-    """Resolve partial analysis ID to full UUID."""
-    # Remove dashes and normalize
-    normalized_id = analysis_id.replace('-', '')
-    
-    if len(normalized_id) < 32:  # Partial ID
-        # Convert to UUID format for LIKE query
-        from sqlalchemy import text
-        result = session.execute(
-            text("SELECT id FROM tara_analyses WHERE REPLACE(CAST(id as TEXT), '-', '') LIKE :partial_id || '%'"),
-            {"partial_id": normalized_id}
-        ).first()
-        
-        if not result:
-            raise AutoGTError(f"No analysis found matching ID: {analysis_id}")
-        
-        return result[0]
-    else:
-        # Try to construct full UUID
-        try:
-            return UUID(analysis_id)
-        except ValueError:
-            # Try with dashes if needed
-            if len(normalized_id) == 32:
-                formatted_uuid = f"{normalized_id[:8]}-{normalized_id[8:12]}-{normalized_id[12:16]}-{normalized_id[16:20]}-{normalized_id[20:]}"
-                return UUID(formatted_uuid)
-            else:
-                raise AutoGTError(f"Invalid analysis ID format: {analysis_id}")
-
-
 def _load_json_assets(file_path: str) -> list:
     """Load assets from JSON file."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -374,33 +345,3 @@ def _load_json_assets(file_path: str) -> list:
         return data['assets']
     else:
         raise AutoGTError("Invalid JSON format. Expected list of assets or object with 'assets' key")
-
-
-def _resolve_analysis_id(session, analysis_id: str) -> UUID:
-    """Resolve partial analysis ID to full UUID."""
-    # Remove dashes and normalize
-    normalized_id = analysis_id.replace('-', '')
-    
-    if len(normalized_id) < 32:  # Partial ID
-        # Convert to UUID format for LIKE query
-        from sqlalchemy import text
-        result = session.execute(
-            text("SELECT id FROM tara_analyses WHERE REPLACE(CAST(id as TEXT), '-', '') LIKE :partial_id || '%'"),
-            {"partial_id": normalized_id}
-        ).first()
-        
-        if not result:
-            raise AutoGTError(f"No analysis found matching ID: {analysis_id}")
-        
-        return result[0]
-    else:
-        # Try to construct full UUID
-        try:
-            return UUID(analysis_id)
-        except ValueError:
-            # Try with dashes if needed
-            if len(normalized_id) == 32:
-                formatted_uuid = f"{normalized_id[:8]}-{normalized_id[8:12]}-{normalized_id[12:16]}-{normalized_id[16:20]}-{normalized_id[20:]}"
-                return UUID(formatted_uuid)
-            else:
-                raise AutoGTError(f"Invalid analysis ID format: {analysis_id}")
\ No newline at end of file
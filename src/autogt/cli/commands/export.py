@@ -135,6 +135,9 @@ def _export_analysis_simple(analysis_id: str, format_type: str = 'json', output_
         cursor.execute("SELECT * FROM cybersecurity_goals WHERE analysis_id = ?", (full_id,))
         goals = [dict(row) for row in cursor.fetchall()]
         
+        # One timestamp for both the export metadata and the generated filename
+        exported_at = datetime.now()
+        
         # Build export data
         export_data = {
             "analysis_metadata": dict(analysis_row),
@@ -145,7 +148,7 @@ def _export_analysis_simple(analysis_id: str, format_type: str = 'json', output_
             "assets": assets,
             "cybersecurity_goals": goals,
             "export_metadata": {
-                "exported_at": datetime.now().isoformat(),
+                "exported_at": exported_at.isoformat(),
                 "export_version": "1.0",
                 "iso_compliance": "ISO/SAE 21434"
             }
@@ -153,7 +156,7 @@ def _export_analysis_simple(analysis_id: str, format_type: str = 'json', output_
         
         # Generate output filename if not provided
         if not output_path:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = exported_at.strftime("%Y%m%d_%H%M%S")
             output_path = f"tara_analysis_{analysis_id[:8]}_{timestamp}.{format_type}"
         
         # Write JSON file
@@ -7,14 +7,15 @@ Handles risk value calculation for TARA analyses.
 import click
 import logging
 import math
+from bisect import bisect_right
 from typing import List, Dict, Any
 from uuid import UUID
 
 from ...lib.exceptions import AutoGTError
-from ...services.database import DatabaseService
+from ..utils import resolve_analysis_id
+from ...services.database import DatabaseService, load_threat_scenarios
 from ...services.autogen_agent import AutoGenTaraAgent
 from ...models.analysis import TaraAnalysis
-from ...models.asset import Asset
 from ...models.threat import ThreatScenario
 from ...models.impact import ImpactRating, SafetyImpact, FinancialImpact, OperationalImpact, PrivacyImpact
 from ...models.attack_feasibility import AttackFeasibility, ElapsedTime, SpecialistExpertise, KnowledgeOfTarget, WindowOfOpportunity, EquipmentRequired
@@ -25,6 +26,49 @@ from ...lib.config import Config
 
 logger = logging.getLogger('autogt.cli.risks')
 
+# Display marker per risk level, in the order levels are listed (highest first)
+_RISK_LEVEL_EMOJI = {
+    RiskLevel.VERY_HIGH: "🔴",
+    RiskLevel.HIGH: "🟠",
+    RiskLevel.MEDIUM: "🟡",
+    RiskLevel.LOW: "🟢",
+}
+
+# Base impact score per asset criticality value (1-4 scale)
+_CRITICALITY_SCORES = {
+    "VERY_HIGH": 4.0,
+    "HIGH": 3.0,
+    "MEDIUM": 2.0,
+    "LOW": 1.0
+}
+
+# Threat actor capability weights used by the mock AI scoring
+_AI_ACTOR_WEIGHTS = {
+    "NATION_STATE": 4.0,
+    "CRIMINAL": 3.0,
+    "INSIDER": 2.5,
+    "SCRIPT_KIDDIE": 1.5
+}
+
+# Impact multiplier per threat actor capability
+_ACTOR_IMPACT_MULTIPLIERS = {
+    "NATION_STATE": 1.2,
+    "CRIMINAL": 1.0,
+    "INSIDER": 0.9,
+    "SCRIPT_KIDDIE": 0.7
+}
+
+# Base feasibility score per threat actor
+_ACTOR_FEASIBILITY_SCORES = {
+    "SCRIPT_KIDDIE": 1.0,
+    "CRIMINAL": 2.0,
+    "INSIDER": 3.0,
+    "NATION_STATE": 4.0
+}
+
+# Risk score (impact x feasibility) lower bounds and the level for each band between them
+_RISK_SCORE_THRESHOLDS = (4.0, 8.0, 12.0)
+_RISK_LEVEL_BANDS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.VERY_HIGH)
 
 @click.group()
 def risks():
@@ -58,7 +102,7 @@ def calculate(ctx: click.Context, analysis_id: str, ai_mode: bool) -> None:
         
         # Resolve analysis ID and verify it exists
         with db_service.get_session() as session:
-            resolved_id = _resolve_analysis_id(session, analysis_id)
+            resolved_id = resolve_analysis_id(session, analysis_id)
             analysis = session.query(TaraAnalysis).filter(
                 TaraAnalysis.id == resolved_id
             ).first()
@@ -67,9 +111,7 @@ def calculate(ctx: click.Context, analysis_id: str, ai_mode: bool) -> None:
                 raise AutoGTError(f"Analysis {analysis_id} not found")
             
             # Get all threat scenarios for this analysis
-            threat_scenarios = session.query(ThreatScenario).join(Asset).filter(
-                Asset.analysis_id == resolved_id
-            ).all()
+            threat_scenarios = load_threat_scenarios(session, resolved_id)
             
             if not threat_scenarios:
                 raise AutoGTError(f"No threat scenarios found for analysis {analysis_id}. Run 'autogt threats identify' first.")
@@ -109,33 +151,6 @@ def calculate(ctx: click.Context, analysis_id: str, ai_mode: bool) -> None:
         raise AutoGTError(f"Failed to calculate risks: {e}")
 
 
-def _resolve_analysis_id(session, analysis_id: str) -> UUID:
-    """Resolve partial analysis ID to full UUID."""
-    # Same implementation as in threats.py
-    normalized_id = analysis_id.replace('-', '')
-    
-    if len(normalized_id) < 32:  # Partial ID
-        from sqlalchemy import text
-        result = session.execute(
-            text("SELECT id FROM tara_analyses WHERE REPLACE(CAST(id as TEXT), '-', '') LIKE :partial_id || '%'"),
-            {"partial_id": normalized_id}
-        ).first()
-        
-        if not result:
-            raise AutoGTError(f"No analysis found matching ID: {analysis_id}")
-        
-        return result[0]
-    else:
-        try:
-            return UUID(analysis_id)
-        except ValueError:
-            if len(normalized_id) == 32:
-                formatted_uuid = f"{normalized_id[:8]}-{normalized_id[8:12]}-{normalized_id[12:16]}-{normalized_id[16:20]}-{normalized_id[20:]}"
-                return UUID(formatted_uuid)
-            else:
-                raise AutoGTError(f"Invalid analysis ID format: {analysis_id}")
-
-
 def _ai_risk_assessment(session, analysis: TaraAnalysis, threat_scenarios: List[ThreatScenario], config: Config) -> int:
     """AI-powered risk assessment using AutoGen agents."""
     try:
@@ -234,19 +249,8 @@ def _rule_based_risk_assessment(session, analysis: TaraAnalysis, threat_scenario
 def _calculate_ai_risk_scores(context: Dict[str, Any]) -> tuple:
     """Calculate AI-based risk scores (mock implementation for demo)."""
     # Mock AI-based scoring - in production, this would use actual AI agents
-    criticality_weight = {
-        "VERY_HIGH": 4.0,
-        "HIGH": 3.0,
-        "MEDIUM": 2.0,
-        "LOW": 1.0
-    }.get(context["criticality"], 2.0)
-    
-    actor_weight = {
-        "NATION_STATE": 4.0,
-        "CRIMINAL": 3.0,
-        "INSIDER": 2.5,
-        "SCRIPT_KIDDIE": 1.5
-    }.get(context["threat_actor"], 2.0)
+    criticality_weight = _CRITICALITY_SCORES.get(context["criticality"], 2.0)
+    actor_weight = _AI_ACTOR_WEIGHTS.get(context["threat_actor"], 2.0)
     
     # AI would analyze complexity based on attack vectors and prerequisites
     complexity = len(context.get("prerequisites", [])) * 0.5
@@ -262,22 +266,10 @@ def _calculate_ai_risk_scores(context: Dict[str, Any]) -> tuple:
 def _calculate_impact_score(threat_scenario: ThreatScenario) -> float:
     """Calculate impact score based on asset criticality and threat characteristics."""
     # Base score from asset criticality
-    criticality_scores = {
-        "VERY_HIGH": 4.0,
-        "HIGH": 3.0, 
-        "MEDIUM": 2.0,
-        "LOW": 1.0
-    }
-    
-    base_score = criticality_scores.get(threat_scenario.asset.criticality_level.value, 2.0)
+    base_score = _CRITICALITY_SCORES.get(threat_scenario.asset.criticality_level.value, 2.0)
     
     # Adjust based on threat actor capability
-    actor_multiplier = {
-        "NATION_STATE": 1.2,
-        "CRIMINAL": 1.0,
-        "INSIDER": 0.9,
-        "SCRIPT_KIDDIE": 0.7
-    }.get(threat_scenario.threat_actor.value, 1.0)
+    actor_multiplier = _ACTOR_IMPACT_MULTIPLIERS.get(threat_scenario.threat_actor.value, 1.0)
     
     return min(4.0, base_score * actor_multiplier)
 
@@ -285,14 +277,7 @@ def _calculate_impact_score(threat_scenario: ThreatScenario) -> float:
 def _calculate_feasibility_score(threat_scenario: ThreatScenario) -> float:
     """Calculate feasibility score based on attack complexity and prerequisites."""
     # Base feasibility from threat actor
-    actor_scores = {
-        "SCRIPT_KIDDIE": 1.0,
-        "CRIMINAL": 2.0,
-        "INSIDER": 3.0,
-        "NATION_STATE": 4.0
-    }
-    
-    base_score = actor_scores.get(threat_scenario.threat_actor.value, 2.0)
+    base_score = _ACTOR_FEASIBILITY_SCORES.get(threat_scenario.threat_actor.value, 2.0)
     
     # Reduce score based on complexity (more prerequisites = harder)
     complexity_penalty = len(threat_scenario.prerequisites) * 0.3
@@ -305,15 +290,7 @@ def _calculate_risk_level(impact_score: float, feasibility_score: float) -> Risk
     """Calculate risk level using ISO/SAE 21434 risk matrix."""
     # ISO/SAE 21434 risk matrix (simplified)
     risk_score = impact_score * feasibility_score
-    
-    if risk_score >= 12.0:
-        return RiskLevel.VERY_HIGH
-    elif risk_score >= 8.0:
-        return RiskLevel.HIGH
-    elif risk_score >= 4.0:
-        return RiskLevel.MEDIUM
-    else:
-        return RiskLevel.LOW
+    return _RISK_LEVEL_BANDS[bisect_right(_RISK_SCORE_THRESHOLDS, risk_score)]
 
 
 def _create_impact_rating(threat_scenario: ThreatScenario, impact_score: float) -> ImpactRating:
@@ -427,33 +404,18 @@ def _create_risk_value(threat_scenario: ThreatScenario, impact_rating, feasibili
 
 def _display_risk_summary(session, analysis_id: UUID) -> None:
     """Display risk summary statistics."""
-    # Get risk distribution
-    risk_counts = session.query(RiskValue).join(Asset).filter(
-        Asset.analysis_id == analysis_id
-    ).all()
+    # Aggregate risk distribution in the database
+    metrics = TaraAnalysis.risk_metrics(session, analysis_id)
     
-    if not risk_counts:
+    if not metrics["total_risks"]:
         return
     
-    # Count by risk level
-    level_counts = {}
-    total_score = 0
-    for risk in risk_counts:
-        level = risk.risk_level.value
-        level_counts[level] = level_counts.get(level, 0) + 1
-        total_score += risk.risk_score
+    level_counts = metrics["level_counts"]
     
     click.echo(f"\n📊 Risk Distribution:")
-    for level in ["VERY_HIGH", "HIGH", "MEDIUM", "LOW"]:
+    for level, emoji in _RISK_LEVEL_EMOJI.items():
         count = level_counts.get(level, 0)
         if count > 0:
-            emoji = {
-                "VERY_HIGH": "🔴",
-                "HIGH": "🟠", 
-                "MEDIUM": "🟡",
-                "LOW": "🟢"
-            }[level]
-            click.echo(f"   {emoji} {level}: {count} risks")
+            click.echo(f"   {emoji} {level.value}: {count} risks")
     
-    avg_score = total_score / len(risk_counts) if risk_counts else 0
-    click.echo(f"   📊 Average Risk Score: {avg_score:.2f}")
\ No newline at end of file
+    click.echo(f"   📊 Average Risk Score: {metrics['average_score']:.2f}")
\ No newline at end of file
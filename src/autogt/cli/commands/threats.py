@@ -8,19 +8,33 @@ import click
 import logging
 import json
 from typing import List, Dict, Any
-from uuid import UUID
 
 from ...lib.exceptions import AutoGTError
+from ..utils import resolve_analysis_id
 from ...services.database import DatabaseService
 from ...services.autogen_agent import AutoGenTaraAgent
 from ...models.analysis import TaraAnalysis
-from ...models.asset import Asset
+from ...models.asset import Asset, CriticalityLevel
 from ...models.threat import ThreatScenario, ThreatActor
 from ...lib.config import Config
 
 
 logger = logging.getLogger('autogt.cli.threats')
 
+# Actor strings produced by AI and rule-based identification mapped to enum members
+_ACTOR_MAPPING = {
+    "SCRIPT_KIDDIE": ThreatActor.SCRIPT_KIDDIE,
+    "CRIMINAL": ThreatActor.CRIMINAL,
+    "NATION_STATE": ThreatActor.NATION_STATE,
+    "INSIDER": ThreatActor.INSIDER,
+    "EXTERNAL_ATTACKER": ThreatActor.CRIMINAL  # Fallback mapping
+}
+
+# Asset criticality levels that receive the additional critical-asset threats
+_HIGH_CRITICALITY_LEVELS = frozenset({CriticalityLevel.HIGH, CriticalityLevel.VERY_HIGH})
+
+# Upper bound on threat identification requests in flight at once (API rate limits)
+_MAX_CONCURRENT_AI_REQUESTS = 4
 
 @click.group()
 def threats():
@@ -54,7 +68,7 @@ def identify(ctx: click.Context, analysis_id: str, ai_mode: bool) -> None:
         
         # Resolve analysis ID and verify it exists
         with db_service.get_session() as session:
-            resolved_id = _resolve_analysis_id(session, analysis_id)
+            resolved_id = resolve_analysis_id(session, analysis_id)
             analysis = session.query(TaraAnalysis).filter(
                 TaraAnalysis.id == resolved_id
             ).first()
@@ -102,36 +116,6 @@ def identify(ctx: click.Context, analysis_id: str, ai_mode: bool) -> None:
         raise AutoGTError(f"Failed to identify threats: {e}")
 
 
-def _resolve_analysis_id(session, analysis_id: str) -> UUID:
-    """Resolve partial analysis ID to full UUID."""
-    # Remove dashes and normalize
-    normalized_id = analysis_id.replace('-', '')
-    
-    if len(normalized_id) < 32:  # Partial ID
-        # Convert to UUID format for LIKE query
-        from sqlalchemy import text
-        result = session.execute(
-            text("SELECT id FROM tara_analyses WHERE REPLACE(CAST(id as TEXT), '-', '') LIKE :partial_id || '%'"),
-            {"partial_id": normalized_id}
-        ).first()
-        
-        if not result:
-            raise AutoGTError(f"No analysis found matching ID: {analysis_id}")
-        
-        return result[0]
-    else:
-        # Try to construct full UUID
-        try:
-            return UUID(analysis_id)
-        except ValueError:
-            # Try with dashes if needed
-            if len(normalized_id) == 32:
-                formatted_uuid = f"{normalized_id[:8]}-{normalized_id[8:12]}-{normalized_id[12:16]}-{normalized_id[16:20]}-{normalized_id[20:]}"
-                return UUID(formatted_uuid)
-            else:
-                raise AutoGTError(f"Invalid analysis ID format: {analysis_id}")
-
-
 def _ai_threat_identification(session, analysis: TaraAnalysis, assets: List[Asset], config: Config) -> int:
     """AI-powered threat identification using AutoGen agents with retry mechanism."""
     import asyncio
@@ -147,6 +131,7 @@ def _ai_threat_identification(session, analysis: TaraAnalysis, assets: List[Asse
         logger.info(f"📡 API endpoint: {gemini_config.base_url}")
         
         threats_added = 0
+        contexts = []
         
         for asset in assets:
             click.echo(f"   🔍 Analyzing asset: {asset.name}")
@@ -165,38 +150,52 @@ def _ai_threat_identification(session, analysis: TaraAnalysis, assets: List[Asse
             }
             
             logger.debug(f"📋 Analysis context: {context}")
+            contexts.append(context)
+        
+        # Use AI agent for threat identification (async calls with retry), overlapping
+        # the per-asset requests; failures are returned per asset instead of raised
+        logger.info("🚀 Calling AI API (with up to 3 retry attempts)...")
+        click.echo(f"      ⏳ Sending {len(contexts)} requests to {gemini_config.model_name}...")
+        
+        async def identify_all() -> list:
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_AI_REQUESTS)
             
-            # Use AI agent for threat identification (async call with retry)
-            logger.info("🚀 Calling AI API (with up to 3 retry attempts)...")
-            click.echo(f"      ⏳ Sending request to {gemini_config.model_name}...")
+            async def identify(context: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await ai_agent.identify_threats(context, max_retries=3)
             
-            try:
-                threat_results = asyncio.run(ai_agent.identify_threats(context, max_retries=3))
-                
-                logger.info(f"✅ AI API returned {len(threat_results.get('threats', []))} threats")
+            return await asyncio.gather(*map(identify, contexts), return_exceptions=True)
+        
+        for asset, threat_results in zip(assets, asyncio.run(identify_all())):
+            if isinstance(threat_results, BaseException):
+                # Cancellation and interrupts are not AI failures; don't fall back on them
+                if not isinstance(threat_results, Exception):
+                    raise threat_results
                 
-                # Process AI results
-                if "threats" in threat_results:
-                    for threat_data in threat_results["threats"]:
-                        logger.debug(f"💾 Saving threat: {threat_data['name']}")
-                        threat_scenario = _create_threat_scenario(
-                            asset, threat_data, "AI_GENERATED"
-                        )
-                        session.add(threat_scenario)
-                        threats_added += 1
-                        click.echo(f"      ✅ AI threat: {threat_data['name']}")
-                else:
-                    logger.warning(f"⚠️ No threats returned for asset {asset.name}")
-                    
-            except Exception as e:
                 # This exception means all retries failed
-                logger.error(f"❌ All retry attempts failed for asset {asset.name}: {e}")
+                logger.error(f"❌ All retry attempts failed for asset {asset.name}: {threat_results}")
                 click.echo(f"      ⚠️ AI analysis failed after 3 retries for {asset.name}")
                 click.echo(f"      🔄 Falling back to rule-based identification...")
                 
                 # Fall back to rule-based for this specific asset
                 fallback_threats = _rule_based_threat_identification_for_asset(session, analysis, asset)
                 threats_added += fallback_threats
+                continue
+            
+            logger.info(f"✅ AI API returned {len(threat_results.get('threats', []))} threats")
+            
+            # Process AI results
+            if "threats" in threat_results:
+                for threat_data in threat_results["threats"]:
+                    logger.debug(f"💾 Saving threat: {threat_data['name']}")
+                    threat_scenario = _create_threat_scenario(
+                        asset, threat_data, "AI_GENERATED"
+                    )
+                    session.add(threat_scenario)
+                    threats_added += 1
+                    click.echo(f"      ✅ AI threat for {asset.name}: {threat_data['name']}")
+            else:
+                logger.warning(f"⚠️ No threats returned for asset {asset.name}")
             
         logger.info(f"🎉 Threat identification complete: {threats_added} threats added")
         return threats_added
@@ -286,6 +285,9 @@ def _rule_based_threat_identification(session, analysis: TaraAnalysis, assets: L
         }
     ]
     
+    # Collect rows for every asset and insert them in one executemany batch
+    threat_mappings = []
+    
     for asset in assets:
         click.echo(f"   📋 Analyzing asset: {asset.name} ({asset.asset_type.value})")
         
@@ -293,45 +295,39 @@ def _rule_based_threat_identification(session, analysis: TaraAnalysis, assets: L
         asset_type = asset.asset_type.value
         if asset_type in threat_patterns:
             for threat_data in threat_patterns[asset_type]:
-                threat_scenario = _create_threat_scenario(
-                    asset, threat_data, "RULE_BASED"
-                )
-                session.add(threat_scenario)
+                threat_mappings.append(_threat_scenario_mapping(asset, threat_data, "RULE_BASED"))
                 threats_added += 1
                 click.echo(f"      ✅ Rule-based threat: {threat_data['name']}")
         
         # Apply critical threats for high-criticality assets
-        if asset.criticality_level.value in ["HIGH", "VERY_HIGH"]:
+        if asset.criticality_level in _HIGH_CRITICALITY_LEVELS:
             for threat_data in critical_threats:
-                threat_scenario = _create_threat_scenario(
-                    asset, threat_data, "CRITICALITY_BASED"
-                )
-                session.add(threat_scenario)
+                threat_mappings.append(_threat_scenario_mapping(asset, threat_data, "CRITICALITY_BASED"))
                 threats_added += 1
                 click.echo(f"      ✅ Critical threat: {threat_data['name']}")
     
+    if threat_mappings:
+        session.bulk_insert_mappings(ThreatScenario, threat_mappings)
+    
     return threats_added
 
 
-def _create_threat_scenario(asset: Asset, threat_data: Dict[str, Any], source: str) -> ThreatScenario:
-    """Create a ThreatScenario object from threat data."""
+def _threat_scenario_mapping(asset: Asset, threat_data: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """Build ThreatScenario column values from threat data."""
     # Map actor string to enum
-    actor_mapping = {
-        "SCRIPT_KIDDIE": ThreatActor.SCRIPT_KIDDIE,
-        "CRIMINAL": ThreatActor.CRIMINAL,
-        "NATION_STATE": ThreatActor.NATION_STATE,
-        "INSIDER": ThreatActor.INSIDER,
-        "EXTERNAL_ATTACKER": ThreatActor.CRIMINAL  # Fallback mapping
-    }
+    actor = _ACTOR_MAPPING.get(threat_data["actor"], ThreatActor.CRIMINAL)
     
-    actor = actor_mapping.get(threat_data["actor"], ThreatActor.CRIMINAL)
-    
-    return ThreatScenario(
-        asset_id=asset.id,
-        threat_name=threat_data["name"],
-        threat_actor=actor,
-        motivation=threat_data["motivation"],
-        attack_vectors=threat_data.get("attack_vectors", []),
-        prerequisites=threat_data.get("prerequisites", []),
-        iso_section=f"21434-15.7-{source}"
-    )
\ No newline at end of file
+    return {
+        "asset_id": asset.id,
+        "threat_name": threat_data["name"],
+        "threat_actor": actor,
+        "motivation": threat_data["motivation"],
+        "attack_vectors": threat_data.get("attack_vectors", []),
+        "prerequisites": threat_data.get("prerequisites", []),
+        "iso_section": f"21434-15.7-{source}"
+    }
+
+
+def _create_threat_scenario(asset: Asset, threat_data: Dict[str, Any], source: str) -> ThreatScenario:
+    """Create a ThreatScenario object from threat data."""
+    return ThreatScenario(**_threat_scenario_mapping(asset, threat_data, source))
\ No newline at end of file
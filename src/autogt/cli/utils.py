@@ -0,0 +1,37 @@
+"""Helpers shared by AutoGT CLI commands."""
+
+from uuid import UUID
+from sqlalchemy import text
+
+from ..lib.exceptions import AutoGTError
+
+
+# Partial analysis ID lookup, built once and reused for every resolution
+_PARTIAL_ID_QUERY = text(
+    "SELECT id FROM tara_analyses WHERE REPLACE(CAST(id as TEXT), '-', '') LIKE :partial_id || '%'"
+)
+
+
+def resolve_analysis_id(session, analysis_id: str) -> UUID:
+    """Resolve partial analysis ID to full UUID."""
+    # Remove dashes and normalize
+    normalized_id = analysis_id.replace('-', '')
+    
+    if len(normalized_id) < 32:  # Partial ID
+        result = session.execute(_PARTIAL_ID_QUERY, {"partial_id": normalized_id}).first()
+        
+        if not result:
+            raise AutoGTError(f"No analysis found matching ID: {analysis_id}")
+        
+        return result[0]
+    else:
+        # Try to construct full UUID
+        try:
+            return UUID(analysis_id)
+        except ValueError:
+            # Try with dashes if needed
+            if len(normalized_id) == 32:
+                formatted_uuid = f"{normalized_id[:8]}-{normalized_id[8:12]}-{normalized_id[12:16]}-{normalized_id[16:20]}-{normalized_id[20:]}"
+                return UUID(formatted_uuid)
+            else:
+                raise AutoGTError(f"Invalid analysis ID format: {analysis_id}")
@@ -5,10 +5,10 @@ Complete assessment workflow container.
 """
 
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime
 from uuid import UUID
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -30,10 +30,36 @@ class CompletionStatus(Enum):
     FAILED = "FAILED"
 
 
+# Statuses of a finished analysis: they require a completion timestamp and
+# report full progress without walking the entity tree
+_FINISHED_STATUSES = frozenset({CompletionStatus.COMPLETED, CompletionStatus.VALIDATED})
+
+# Input file extensions accepted for analysis import
+_SUPPORTED_INPUT_EXTENSIONS = ('.xlsx', '.xls', '.csv', '.json', '.txt')
+
+# Progress percentage per step number returned by get_current_step(): the share
+# of the eight steps done before it. Comments give the matching TaraStep.
+_STEP_PROGRESS = {
+    1: 0,    # ASSET_IDENTIFICATION
+    2: 12,   # IMPACT_RATING
+    3: 25,   # THREAT_SCENARIO_IDENTIFICATION
+    4: 37,   # ATTACK_PATH_ANALYSIS
+    5: 50,   # ATTACK_FEASIBILITY_RATING
+    6: 62,   # RISK_VALUE_DETERMINATION
+    7: 75,   # RISK_TREATMENT_DECISION
+    8: 87,   # CYBERSECURITY_GOALS
+}
+
+
 class TaraAnalysis(BaseModel):
     """TaraAnalysis model representing complete assessment workflow container."""
     
     __tablename__ = "tara_analyses"
+    __table_args__ = (
+        # Analysis listings sort newest first, optionally filtered by status
+        Index("ix_tara_analyses_created_at", "created_at"),
+        Index("ix_tara_analyses_status_created_at", "completion_status", "created_at"),
+    )
     
     # Core identification
     analysis_name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
@@ -64,6 +90,105 @@ class TaraAnalysis(BaseModel):
     def __repr__(self) -> str:
         return f"<TaraAnalysis(id={self.id}, name='{self.analysis_name}', status={self.completion_status.value})>"
     
+    @classmethod
+    def report_load_options(cls) -> tuple:
+        """Loader options covering every relationship read by progress and reports.
+        
+        Each level is fetched with one SELECT ... IN query rather than lazily per
+        row, so get_current_step() and report counts issue a fixed number of
+        queries regardless of analysis size.
+        """
+        from sqlalchemy.orm import selectinload
+        from .asset import Asset
+        from .threat import ThreatScenario
+        from .attack_path import AttackPath
+        from .risk import RiskValue
+        
+        assets = selectinload(cls.assets)
+        threat_scenarios = assets.selectinload(Asset.threat_scenarios)
+        return (
+            assets.selectinload(Asset.impact_ratings),
+            assets.selectinload(Asset.risk_values).selectinload(RiskValue.risk_treatment),
+            threat_scenarios.selectinload(ThreatScenario.risk_values),
+            threat_scenarios.selectinload(ThreatScenario.attack_paths)
+            .selectinload(AttackPath.attack_feasibility),
+            selectinload(cls.cybersecurity_goals),
+        )
+    
+    @classmethod
+    def get_for_report(cls, session, analysis_id) -> Optional["TaraAnalysis"]:
+        """Load an analysis with its full relationship tree eagerly loaded.
+        
+        The returned instance can be used for progress and report calculations
+        after the session is closed.
+        """
+        return session.query(cls).options(*cls.report_load_options()).filter(
+            cls.id == analysis_id
+        ).first()
+    
+    @classmethod
+    def risk_metrics(cls, session, analysis_id) -> Dict[str, Any]:
+        """Aggregate risk values of an analysis with one GROUP BY query.
+        
+        Returns:
+            Dictionary with per-level counts, total risk count and average score
+        """
+        from sqlalchemy import func
+        from .asset import Asset
+        from .risk import RiskValue
+        
+        rows = session.query(
+            RiskValue.risk_level, func.count(RiskValue.id), func.sum(RiskValue.risk_score)
+        ).join(Asset, RiskValue.asset_id == Asset.id).filter(
+            Asset.analysis_id == analysis_id
+        ).group_by(RiskValue.risk_level).all()
+        
+        level_counts = {level: count for level, count, _ in rows}
+        total_risks = sum(level_counts.values())
+        total_score = sum(score_sum or 0.0 for _, _, score_sum in rows)
+        
+        return {
+            "level_counts": level_counts,
+            "total_risks": total_risks,
+            "average_score": total_score / total_risks if total_risks else 0.0,
+        }
+    
+    @classmethod
+    def iter_risk_values(cls, session, analysis_id, chunk_size: int = 1000) -> Iterator["RiskValue"]:
+        """Stream the risk values of an analysis in fixed-size chunks.
+        
+        Rows are fetched with yield_per, so memory stays bounded by chunk_size
+        rather than the analysis size. Relationships are left to load lazily on
+        access instead of being eagerly fetched per chunk. Prefer risk_metrics()
+        when only aggregate counts are needed.
+        """
+        from sqlalchemy import select
+        from sqlalchemy.orm import lazyload
+        from .asset import Asset
+        from .risk import RiskValue
+        
+        stmt = select(RiskValue).join(Asset, RiskValue.asset_id == Asset.id).where(
+            Asset.analysis_id == analysis_id
+        ).options(lazyload("*")).execution_options(yield_per=chunk_size)
+        yield from session.scalars(stmt)
+    
+    @classmethod
+    def validate_batch(cls, session) -> Dict[UUID, List[str]]:
+        """Run the instance validation rules over every analysis with one query.
+        
+        Only the validated columns are loaded. Name uniqueness is already
+        enforced by the unique constraint on analysis_name and is not rechecked.
+        
+        Returns:
+            Error messages per analysis id, for analyses failing any rule
+        """
+        from sqlalchemy.orm import load_only
+        
+        analyses = session.query(cls).options(load_only(
+            cls.completion_status, cls.input_file_path, cls.output_file_path, cls.completed_at
+        )).all()
+        return {analysis.id: errors for analysis in analyses if (errors := analysis.validate())}
+    
     def validate_analysis_name_uniqueness(self, session) -> bool:
         """Validate analysis name is unique per user session.
         
@@ -87,76 +212,92 @@ class TaraAnalysis(BaseModel):
         if not self.input_file_path:
             return True  # No file is valid for interactive analyses
             
-        supported_extensions = ['.xlsx', '.xls', '.csv', '.json', '.txt']
-        return any(self.input_file_path.lower().endswith(ext) for ext in supported_extensions)
+        return self.input_file_path.lower().endswith(_SUPPORTED_INPUT_EXTENSIONS)
     
     def validate_output_file_generated_on_completion(self) -> bool:
         """Validate output file is generated only upon completion.
         
         Reference: data-model.md validation rules
         """
-        if self.completion_status == CompletionStatus.IN_PROGRESS:
+        if self.completion_status is CompletionStatus.IN_PROGRESS:
             return self.output_file_path is None
         else:
             return self.output_file_path is not None
     
     def validate_completion_timestamp(self) -> bool:
         """Validate completion timestamp is set when status is completed."""
-        if self.completion_status in [CompletionStatus.COMPLETED, CompletionStatus.VALIDATED]:
+        if self.completion_status in _FINISHED_STATUSES:
             return self.completed_at is not None
         else:
             return self.completed_at is None
     
+    def validate(self) -> List[str]:
+        """Run the instance validation rules.
+        
+        Name uniqueness needs a session and is checked separately via
+        validate_analysis_name_uniqueness().
+        
+        Returns:
+            Error messages of the rules that failed (empty when valid)
+        """
+        return [message for predicate, message in _VALIDATION_RULES if not predicate(self)]
+    
     def get_current_step(self) -> int:
-        """Get current step in 8-step TARA process based on completed entities."""
-        if not self.assets:
-            return 1  # Step 1: Asset definition
+        """Get current step in 8-step TARA process based on completed entities.
         
-        # Check if all assets have impact ratings (Step 2)
-        if not all(asset.impact_ratings for asset in self.assets):
-            return 2  # Step 2: Impact rating
+        The current step is the earliest step not yet complete for every asset,
+        found in a single pass over the asset tree.
+        """
+        assets = self.assets
+        if not assets:
+            return 1  # Step 1: Asset definition
         
-        # Check if all assets have threat scenarios (Step 3)
-        if not all(asset.threat_scenarios for asset in self.assets):
-            return 3  # Step 3: Threat identification
+        current_step = 8  # Step 8: Cybersecurity goals (or complete)
+        for asset in assets:
+            # Step 2: Impact rating - nothing can precede it
+            if not asset.impact_ratings:
+                return 2
+            
+            # Step 3: Threat identification
+            threat_scenarios = asset.threat_scenarios
+            if current_step > 3 and not threat_scenarios:
+                current_step = 3
+            
+            # Steps 4-5: Attack paths and their feasibility assessments
+            if current_step > 4:
+                for scenario in threat_scenarios:
+                    attack_paths = scenario.attack_paths
+                    if not attack_paths:
+                        current_step = 4
+                        break
+                    if current_step > 5 and not all(path.attack_feasibility for path in attack_paths):
+                        current_step = 5
+            
+            # Step 6: Risk values
+            risk_values = asset.risk_values
+            if current_step > 6 and not risk_values:
+                current_step = 6
+            
+            # Step 7: Risk treatment
+            if current_step > 7 and not all(risk.risk_treatment for risk in risk_values):
+                current_step = 7
         
-        # Check if all threat scenarios have attack paths (Step 4)
-        all_have_paths = all(
-            scenario.attack_paths 
-            for asset in self.assets 
-            for scenario in asset.threat_scenarios
-        )
-        if not all_have_paths:
-            return 4  # Step 4: Attack paths
-        
-        # Check if all attack paths have feasibility assessments (Step 5)
-        all_have_feasibility = all(
-            path.attack_feasibility 
-            for asset in self.assets 
-            for scenario in asset.threat_scenarios
-            for path in scenario.attack_paths
-        )
-        if not all_have_feasibility:
-            return 5  # Step 5: Attack feasibility
-        
-        # Check if all combinations have risk values (Step 6)
-        if not all(asset.risk_values for asset in self.assets):
-            return 6  # Step 6: Risk values
-        
-        # Check if all risk values have treatments (Step 7)
-        all_have_treatments = all(
-            risk.risk_treatment 
-            for asset in self.assets 
-            for risk in asset.risk_values
-        )
-        if not all_have_treatments:
-            return 7  # Step 7: Risk treatment
+        return current_step
+    
+    def get_progress_percentage(self, current_step: Optional[int] = None) -> int:
+        """Get completion percentage of the 8-step TARA process.
         
-        # Check if all treatments have cybersecurity goals (Step 8)
-        if not self.cybersecurity_goals:
-            return 8  # Step 8: Cybersecurity goals
+        Args:
+            current_step: Result of get_current_step() if already known
+        """
+        if self.completion_status in _FINISHED_STATUSES:
+            return 100
+        elif self.completion_status is CompletionStatus.FAILED:
+            return 0
         
-        return 8  # Complete
+        if current_step is None:
+            current_step = self.get_current_step()
+        return _STEP_PROGRESS.get(current_step, 0)
     
     def mark_completed(self) -> None:
         """Mark analysis as completed with timestamp."""
@@ -165,5 +306,15 @@ class TaraAnalysis(BaseModel):
     
     def mark_validated(self) -> None:
         """Mark analysis as validated."""
-        if self.completion_status == CompletionStatus.COMPLETED:
-            self.completion_status = CompletionStatus.VALIDATED
\ No newline at end of file
+        if self.completion_status is CompletionStatus.COMPLETED:
+            self.completion_status = CompletionStatus.VALIDATED
+
+
+# Instance validation rules evaluated by TaraAnalysis.validate(), as (predicate, error message)
+_VALIDATION_RULES = (
+    (TaraAnalysis.validate_input_file_format, "Input file format is not supported"),
+    (TaraAnalysis.validate_output_file_generated_on_completion,
+     "Output file must be generated only upon completion"),
+    (TaraAnalysis.validate_completion_timestamp,
+     "Completion timestamp must be set only for completed analyses"),
+)
@@ -4,13 +4,15 @@ Reference: data-model.md lines 5-33 (Asset entity definition)
 Represents vehicle system components subject to cybersecurity analysis.
 """
 
+import re
 from enum import Enum
 from typing import Dict, List, Optional
 from uuid import UUID
-from sqlalchemy import String, Text, JSON, ForeignKey
+from sqlalchemy import String, Text, ForeignKey, Index, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import BaseModel
+from .base import BaseModel, JSONType
 
 
 class AssetType(Enum):
@@ -30,10 +32,24 @@ class CriticalityLevel(Enum):
     VERY_HIGH = "VERY_HIGH"
 
 
+# Criticality levels acceptable for safety-critical assets
+_SAFETY_CRITICAL_LEVELS = frozenset({CriticalityLevel.HIGH, CriticalityLevel.VERY_HIGH})
+
+# ISO/SAE 21434 section reference, e.g. "ISO/SAE 21434-15.6" or "21434-15.6"
+_ISO_SECTION_RE = re.compile(r'^ISO\/SAE\s21434-\d+(\.\d+)*$|^21434-\d+(\.\d+)*$')
+
+
 class Asset(BaseModel):
     """Asset model representing vehicle system components."""
     
     __tablename__ = "assets"
+    __table_args__ = (
+        # Assets are looked up per analysis, and by name within an analysis
+        Index("ix_assets_analysis_id_name", "analysis_id", "name"),
+        Index(
+            "ix_assets_security_properties", "security_properties", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Core fields
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -41,9 +57,9 @@ class Asset(BaseModel):
     criticality_level: Mapped[CriticalityLevel] = mapped_column(nullable=False)
     
     # JSON fields for complex data
-    interfaces: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
-    data_flows: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
-    security_properties: Mapped[Dict] = mapped_column(JSON, nullable=False, default=dict)
+    interfaces: Mapped[List[str]] = mapped_column(JSONType, nullable=False, default=list)
+    data_flows: Mapped[List[str]] = mapped_column(JSONType, nullable=False, default=list)
+    security_properties: Mapped[Dict] = mapped_column(JSONType, nullable=False, default=dict)
     
     # ISO/SAE 21434 traceability
     iso_section: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -66,6 +82,16 @@ class Asset(BaseModel):
     def __repr__(self) -> str:
         return f"<Asset(id={self.id}, name='{self.name}', type={self.asset_type.value})>"
     
+    @hybrid_property
+    def is_safety_critical(self) -> bool:
+        """Whether security properties flag the asset as safety-critical."""
+        return bool(self.security_properties.get('safety', {}).get('critical', False))
+    
+    @is_safety_critical.inplace.expression
+    @classmethod
+    def _is_safety_critical_expression(cls):
+        return func.coalesce(cls.security_properties['safety']['critical'].as_boolean(), False)
+    
     def validate_name_uniqueness(self, session) -> bool:
         """Validate name uniqueness within analysis.
         
@@ -88,9 +114,7 @@ class Asset(BaseModel):
         Reference: data-model.md validation rules
         """
         # ISO/SAE 21434 section format validation
-        import re
-        pattern = r'^ISO\/SAE\s21434-\d+(\.\d+)*$|^21434-\d+(\.\d+)*$'
-        return bool(re.match(pattern, self.iso_section))
+        return bool(_ISO_SECTION_RE.match(self.iso_section))
     
     def validate_criticality_alignment(self) -> bool:
         """Validate criticality level aligns with safety requirements.
@@ -98,9 +122,6 @@ class Asset(BaseModel):
         Reference: data-model.md validation rules
         """
         # Safety-critical assets should have HIGH or VERY_HIGH criticality
-        safety_props = self.security_properties.get('safety', {})
-        is_safety_critical = safety_props.get('critical', False)
-        
-        if is_safety_critical:
-            return self.criticality_level in [CriticalityLevel.HIGH, CriticalityLevel.VERY_HIGH]
+        if self.is_safety_critical:
+            return self.criticality_level in _SAFETY_CRITICAL_LEVELS
         return True
\ No newline at end of file
@@ -7,7 +7,8 @@ Assessment of attack likelihood and difficulty.
 from enum import Enum
 from typing import List
 from uuid import UUID
-from sqlalchemy import String, Float, ForeignKey
+from sqlalchemy import String, Float, ForeignKey, Numeric, case, cast, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -54,13 +55,67 @@ class EquipmentRequired(Enum):
     MULTIPLE_BESPOKE = "MULTIPLE_BESPOKE"
 
 
+# ISO/SAE 21434 scoring matrix
+_TIME_SCORES = {
+    ElapsedTime.MINUTES: 1.0,
+    ElapsedTime.HOURS: 0.8,
+    ElapsedTime.DAYS: 0.6,
+    ElapsedTime.WEEKS: 0.4,
+    ElapsedTime.MONTHS: 0.2,
+}
+
+_EXPERTISE_SCORES = {
+    SpecialistExpertise.NONE: 1.0,
+    SpecialistExpertise.LIMITED: 0.8,
+    SpecialistExpertise.PROFICIENT: 0.5,
+    SpecialistExpertise.EXPERT: 0.2,
+}
+
+_KNOWLEDGE_SCORES = {
+    KnowledgeOfTarget.PUBLIC: 1.0,
+    KnowledgeOfTarget.RESTRICTED: 0.7,
+    KnowledgeOfTarget.SENSITIVE: 0.4,
+    KnowledgeOfTarget.CRITICAL: 0.1,
+}
+
+_OPPORTUNITY_SCORES = {
+    WindowOfOpportunity.UNLIMITED: 1.0,
+    WindowOfOpportunity.MODERATE: 0.7,
+    WindowOfOpportunity.DIFFICULT: 0.4,
+    WindowOfOpportunity.NONE: 0.1,
+}
+
+_EQUIPMENT_SCORES = {
+    EquipmentRequired.STANDARD: 1.0,
+    EquipmentRequired.SPECIALIZED: 0.7,
+    EquipmentRequired.BESPOKE: 0.4,
+    EquipmentRequired.MULTIPLE_BESPOKE: 0.2,
+}
+
+# Factor weights folded into the tables, so scoring is lookups and adds only
+_WEIGHTED_TIME_SCORES = {member: score * 0.3 for member, score in _TIME_SCORES.items()}
+_WEIGHTED_EXPERTISE_SCORES = {member: score * 0.25 for member, score in _EXPERTISE_SCORES.items()}
+_WEIGHTED_KNOWLEDGE_SCORES = {member: score * 0.2 for member, score in _KNOWLEDGE_SCORES.items()}
+_WEIGHTED_OPPORTUNITY_SCORES = {member: score * 0.15 for member, score in _OPPORTUNITY_SCORES.items()}
+_WEIGHTED_EQUIPMENT_SCORES = {member: score * 0.1 for member, score in _EQUIPMENT_SCORES.items()}
+
+# (column, enum, weighted score table) for each feasibility factor
+_FEASIBILITY_FACTORS = (
+    ("elapsed_time", ElapsedTime, _WEIGHTED_TIME_SCORES),
+    ("specialist_expertise", SpecialistExpertise, _WEIGHTED_EXPERTISE_SCORES),
+    ("knowledge_of_target", KnowledgeOfTarget, _WEIGHTED_KNOWLEDGE_SCORES),
+    ("window_of_opportunity", WindowOfOpportunity, _WEIGHTED_OPPORTUNITY_SCORES),
+    ("equipment_required", EquipmentRequired, _WEIGHTED_EQUIPMENT_SCORES),
+)
+
+
 class AttackFeasibility(BaseModel):
     """AttackFeasibility model representing assessment of attack likelihood."""
     
     __tablename__ = "attack_feasibilities"
     
     # Core fields
-    attack_path_id: Mapped[UUID] = mapped_column(ForeignKey("attack_paths.id"), nullable=False)
+    attack_path_id: Mapped[UUID] = mapped_column(ForeignKey("attack_paths.id"), nullable=False, index=True)
     
     # Feasibility factors
     elapsed_time: Mapped[ElapsedTime] = mapped_column(nullable=False)
@@ -86,54 +141,42 @@ class AttackFeasibility(BaseModel):
         
         Reference: data-model.md validation rules
         """
-        # ISO/SAE 21434 scoring matrix
-        time_scores = {
-            ElapsedTime.MINUTES: 1.0,
-            ElapsedTime.HOURS: 0.8,
-            ElapsedTime.DAYS: 0.6,
-            ElapsedTime.WEEKS: 0.4,
-            ElapsedTime.MONTHS: 0.2,
-        }
-        
-        expertise_scores = {
-            SpecialistExpertise.NONE: 1.0,
-            SpecialistExpertise.LIMITED: 0.8,
-            SpecialistExpertise.PROFICIENT: 0.5,
-            SpecialistExpertise.EXPERT: 0.2,
-        }
-        
-        knowledge_scores = {
-            KnowledgeOfTarget.PUBLIC: 1.0,
-            KnowledgeOfTarget.RESTRICTED: 0.7,
-            KnowledgeOfTarget.SENSITIVE: 0.4,
-            KnowledgeOfTarget.CRITICAL: 0.1,
-        }
-        
-        opportunity_scores = {
-            WindowOfOpportunity.UNLIMITED: 1.0,
-            WindowOfOpportunity.MODERATE: 0.7,
-            WindowOfOpportunity.DIFFICULT: 0.4,
-            WindowOfOpportunity.NONE: 0.1,
-        }
-        
-        equipment_scores = {
-            EquipmentRequired.STANDARD: 1.0,
-            EquipmentRequired.SPECIALIZED: 0.7,
-            EquipmentRequired.BESPOKE: 0.4,
-            EquipmentRequired.MULTIPLE_BESPOKE: 0.2,
-        }
-        
         # Calculate weighted average
         total_score = (
-            time_scores[self.elapsed_time] * 0.3 +
-            expertise_scores[self.specialist_expertise] * 0.25 +
-            knowledge_scores[self.knowledge_of_target] * 0.2 +
-            opportunity_scores[self.window_of_opportunity] * 0.15 +
-            equipment_scores[self.equipment_required] * 0.1
+            _WEIGHTED_TIME_SCORES[self.elapsed_time] +
+            _WEIGHTED_EXPERTISE_SCORES[self.specialist_expertise] +
+            _WEIGHTED_KNOWLEDGE_SCORES[self.knowledge_of_target] +
+            _WEIGHTED_OPPORTUNITY_SCORES[self.window_of_opportunity] +
+            _WEIGHTED_EQUIPMENT_SCORES[self.equipment_required]
         )
         
         return round(total_score, 3)
     
+    @hybrid_property
+    def derived_feasibility_score(self) -> float:
+        """Feasibility score derived from the factor columns.
+        
+        In Python this is calculate_feasibility_score(); at class level it is
+        an equivalent SQL expression, so reports can aggregate or filter on the
+        derived score without loading each row.
+        """
+        return self.calculate_feasibility_score()
+    
+    @derived_feasibility_score.inplace.expression
+    @classmethod
+    def _derived_feasibility_score_expression(cls):
+        factor_scores = [
+            case(*[
+                (getattr(cls, column) == member, score)
+                for member, score in weighted_scores.items()
+            ])
+            for column, _, weighted_scores in _FEASIBILITY_FACTORS
+        ]
+        total_score = factor_scores[0]
+        for factor_score in factor_scores[1:]:
+            total_score = total_score + factor_score
+        return func.round(cast(total_score, Numeric), 3)
+    
     def validate_feasibility_score(self) -> bool:
         """Validate feasibility score is between 0.0 and 1.0.
         
@@ -4,28 +4,42 @@ Reference: data-model.md lines 62-87 (AttackPath entity definition)
 Detailed sequence of attack steps for threat scenarios.
 """
 
+import re
 from typing import Dict, List
 from uuid import UUID
-from sqlalchemy import String, Text, JSON, Integer, ForeignKey
+from sqlalchemy import String, Text, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import BaseModel
+from .base import BaseModel, JSONType
+
+
+# Security control types a technical barrier must mention (case-insensitive substring match)
+_SECURITY_CONTROL_RE = re.compile(
+    r"authentication|authorization|encryption|firewall|ids|ips|"
+    r"access_control|logging|monitoring|integrity_check|signature",
+    re.IGNORECASE
+)
 
 
 class AttackPath(BaseModel):
     """AttackPath model representing detailed sequence of attack steps."""
     
     __tablename__ = "attack_paths"
+    __table_args__ = (
+        Index(
+            "ix_attack_paths_technical_barriers", "technical_barriers", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Core fields
-    threat_scenario_id: Mapped[UUID] = mapped_column(ForeignKey("threat_scenarios.id"), nullable=False)
+    threat_scenario_id: Mapped[UUID] = mapped_column(ForeignKey("threat_scenarios.id"), nullable=False, index=True)
     step_sequence: Mapped[int] = mapped_column(Integer, nullable=False)
     attack_step: Mapped[str] = mapped_column(Text, nullable=False)
     
     # JSON fields for complex data
-    intermediate_targets: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
-    technical_barriers: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
-    required_resources: Mapped[Dict] = mapped_column(JSON, nullable=False, default=dict)
+    intermediate_targets: Mapped[List[str]] = mapped_column(JSONType, nullable=False, default=list)
+    technical_barriers: Mapped[List[str]] = mapped_column(JSONType, nullable=False, default=list)
+    required_resources: Mapped[Dict] = mapped_column(JSONType, nullable=False, default=dict)
     
     # Relationships
     threat_scenario: Mapped["ThreatScenario"] = relationship("ThreatScenario", back_populates="attack_paths")
@@ -54,13 +68,12 @@ class AttackPath(BaseModel):
             )
         ).all()
         
-        all_steps = sorted([step[0] for step in existing_steps] + [self.step_sequence])
+        step_count = len(existing_steps) + 1
         
-        # Check for consecutive sequence starting from 1
-        for i, step in enumerate(all_steps, 1):
-            if step != i:
-                return False
-        return True
+        # Steps must be exactly 1..n; any duplicate leaves the set short of n members
+        steps = {step for step, in existing_steps}
+        steps.add(self.step_sequence)
+        return steps == set(range(1, step_count + 1))
     
     def validate_intermediate_targets(self, session) -> bool:
         """Validate intermediate targets exist as assets or are external.
@@ -97,14 +110,6 @@ class AttackPath(BaseModel):
         if not self.technical_barriers:
             return True
             
-        # Common security control types
-        control_types = [
-            "authentication", "authorization", "encryption", "firewall", "ids", "ips",
-            "access_control", "logging", "monitoring", "integrity_check", "signature"
-        ]
-        
-        for barrier in self.technical_barriers:
-            # Each barrier should reference a known security control type
-            if not any(control in barrier.lower() for control in control_types):
-                return False
-        return True
\ No newline at end of file
+        # Each barrier should reference a known security control type
+        search = _SECURITY_CONTROL_RE.search
+        return all(search(barrier) for barrier in self.technical_barriers)
\ No newline at end of file
@@ -2,9 +2,9 @@
 
 from datetime import datetime
 from uuid import UUID, uuid4
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import JSON, DateTime, String, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.types import TypeDecorator, CHAR
 
 
@@ -43,6 +43,23 @@ class GUID(TypeDecorator):
             return value
 
 
+class JSONType(TypeDecorator):
+    """Platform-independent JSON type.
+    
+    Uses PostgreSQL's binary JSONB type when available so documents are
+    stored pre-parsed and can be GIN-indexed, otherwise generic JSON.
+    """
+    
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(JSONB())
+        else:
+            return dialect.type_descriptor(JSON())
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
     
@@ -7,10 +7,10 @@ Specific security objectives derived from risk analysis.
 from enum import Enum
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy import String, Text, JSON, ForeignKey
+from sqlalchemy import String, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import BaseModel
+from .base import BaseModel, JSONType
 
 
 class ProtectionLevel(Enum):
@@ -29,10 +29,24 @@ class ImplementationPhase(Enum):
     VALIDATION = "VALIDATION"
 
 
+# Protection levels acceptable per residual risk level (higher risk needs a higher CAL)
+_ACCEPTABLE_PROTECTION_LEVELS = {
+    "VERY_HIGH": frozenset({ProtectionLevel.CAL4}),
+    "HIGH": frozenset({ProtectionLevel.CAL3, ProtectionLevel.CAL4}),
+    "MEDIUM": frozenset({ProtectionLevel.CAL2, ProtectionLevel.CAL3, ProtectionLevel.CAL4}),
+    "LOW": frozenset(ProtectionLevel),
+}
+
+
 class CybersecurityGoal(BaseModel):
     """CybersecurityGoal model representing specific security objectives."""
     
     __tablename__ = "cybersecurity_goals"
+    __table_args__ = (
+        Index(
+            "ix_cybersecurity_goals_security_controls", "security_controls", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Core fields
     risk_treatment_id: Mapped[Optional[UUID]] = mapped_column(ForeignKey("risk_treatments.id"), nullable=True)
@@ -43,7 +57,7 @@ class CybersecurityGoal(BaseModel):
     implementation_phase: Mapped[ImplementationPhase] = mapped_column(nullable=False)
     
     # Goal details
-    security_controls: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
+    security_controls: Mapped[List[str]] = mapped_column(JSONType, nullable=False, default=list)
     verification_method: Mapped[str] = mapped_column(Text, nullable=False)
     
     # ISO/SAE 21434 traceability
@@ -65,15 +79,8 @@ class CybersecurityGoal(BaseModel):
             return False
             
         # Protection level should be inverse to residual risk level
-        risk_to_protection = {
-            "VERY_HIGH": [ProtectionLevel.VERY_HIGH],
-            "HIGH": [ProtectionLevel.HIGH, ProtectionLevel.VERY_HIGH],
-            "MEDIUM": [ProtectionLevel.MEDIUM, ProtectionLevel.HIGH, ProtectionLevel.VERY_HIGH],
-            "LOW": [ProtectionLevel.BASIC, ProtectionLevel.MEDIUM, ProtectionLevel.HIGH, ProtectionLevel.VERY_HIGH],
-        }
-        
         residual_risk = self.risk_treatment.residual_risk_level.value
-        acceptable_levels = risk_to_protection.get(residual_risk, [])
+        acceptable_levels = _ACCEPTABLE_PROTECTION_LEVELS.get(residual_risk, frozenset())
         
         return self.protection_level in acceptable_levels
     
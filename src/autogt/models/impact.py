@@ -45,6 +45,16 @@ class PrivacyImpact(Enum):
     SEVERE = "SEVERE"
 
 
+# Severity score by ordinal: every impact enum is declared from least to most severe
+_SEVERITY_SCORES = (0.0, 0.3, 0.7, 1.0)
+
+# Per-category score tables, built once at import time
+_SAFETY_SCORES = dict(zip(SafetyImpact, _SEVERITY_SCORES))
+_FINANCIAL_SCORES = dict(zip(FinancialImpact, _SEVERITY_SCORES))
+_OPERATIONAL_SCORES = dict(zip(OperationalImpact, _SEVERITY_SCORES))
+_PRIVACY_SCORES = dict(zip(PrivacyImpact, _SEVERITY_SCORES))
+
+
 class ImpactRating(BaseModel):
     """ImpactRating model representing quantified assessment of potential damage."""
     
@@ -79,71 +89,41 @@ class ImpactRating(BaseModel):
         
         Reference: data-model.md validation rules
         """
-        safety_scores = {
-            SafetyImpact.NONE: 0.0,
-            SafetyImpact.MODERATE: 0.3,
-            SafetyImpact.MAJOR: 0.7,
-            SafetyImpact.HAZARDOUS: 1.0,
-        }
-        
-        financial_scores = {
-            FinancialImpact.NEGLIGIBLE: 0.0,
-            FinancialImpact.MODERATE: 0.3,
-            FinancialImpact.MAJOR: 0.7,
-            FinancialImpact.SEVERE: 1.0,
-        }
-        
-        operational_scores = {
-            OperationalImpact.NONE: 0.0,
-            OperationalImpact.DEGRADED: 0.3,
-            OperationalImpact.MAJOR: 0.7,
-            OperationalImpact.LOSS: 1.0,
-        }
-        
-        privacy_scores = {
-            PrivacyImpact.NONE: 0.0,
-            PrivacyImpact.MODERATE: 0.3,
-            PrivacyImpact.MAJOR: 0.7,
-            PrivacyImpact.SEVERE: 1.0,
-        }
-        
-        # Take maximum impact across categories
-        max_impact = max(
-            safety_scores[self.safety_impact],
-            financial_scores[self.financial_impact],
-            operational_scores[self.operational_impact],
-            privacy_scores[self.privacy_impact]
+        # Take maximum impact across categories; table values are already exact
+        return max(
+            _SAFETY_SCORES[self.safety_impact],
+            _FINANCIAL_SCORES[self.financial_impact],
+            _OPERATIONAL_SCORES[self.operational_impact],
+            _PRIVACY_SCORES[self.privacy_impact]
         )
-        
-        return round(max_impact, 3)
     
     def validate_safety_alignment(self) -> bool:
         """Validate safety impact aligns with vehicle safety requirements.
         
         Reference: data-model.md validation rules
         """
-        if not self.asset:
+        # Only a NONE safety rating can conflict, so skip the asset lookup otherwise
+        if self.safety_impact is not SafetyImpact.NONE:
+            return self.asset is not None
+        
+        asset = self.asset
+        if not asset:
             return False
             
         # Safety-critical assets should have appropriate safety impact ratings
-        safety_props = self.asset.security_properties.get('safety', {})
-        is_safety_critical = safety_props.get('critical', False)
-        
-        if is_safety_critical and self.safety_impact == SafetyImpact.NONE:
-            return False
-        return True
+        return not asset.is_safety_critical
     
     def validate_non_zero_impact(self) -> bool:
         """Validate at least one impact category is non-zero.
         
         Reference: data-model.md validation rules
         """
-        return any([
-            self.safety_impact != SafetyImpact.NONE,
-            self.financial_impact != FinancialImpact.NEGLIGIBLE,
-            self.operational_impact != OperationalImpact.NONE,
-            self.privacy_impact != PrivacyImpact.NONE,
-        ])
+        return (
+            self.safety_impact is not SafetyImpact.NONE
+            or self.financial_impact is not FinancialImpact.NEGLIGIBLE
+            or self.operational_impact is not OperationalImpact.NONE
+            or self.privacy_impact is not PrivacyImpact.NONE
+        )
     
     def update_calculated_score(self) -> None:
         """Update impact score based on current enum values."""
@@ -4,9 +4,12 @@ Reference: data-model.md lines 142-168 (RiskValue entity definition)
 Calculated combination of impact rating and attack feasibility.
 """
 
+from bisect import bisect_right
 from enum import Enum
+from math import fabs
+from typing import Iterable, Tuple
 from uuid import UUID
-from sqlalchemy import String, Float, ForeignKey
+from sqlalchemy import String, Float, ForeignKey, Index, select
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -20,16 +23,27 @@ class RiskLevel(Enum):
     VERY_HIGH = "VERY_HIGH"
 
 
+# Score thresholds (ascending) and the level each band maps to per ISO/SAE 21434
+_RISK_THRESHOLDS = (0.3, 0.6, 0.8)
+_RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.VERY_HIGH)
+
+# Relationships that must resolve for a risk value to be valid
+_REFERENCED_ENTITIES = ("asset", "threat_scenario", "impact_rating", "attack_feasibility")
+
+
 class RiskValue(BaseModel):
     """RiskValue model representing calculated risk combination."""
     
     __tablename__ = "risk_values"
+    __table_args__ = (
+        Index("ix_risk_values_asset_level_score", "asset_id", "risk_level", "risk_score"),
+    )
     
     # Core fields
     asset_id: Mapped[UUID] = mapped_column(ForeignKey("assets.id"), nullable=False)
-    threat_scenario_id: Mapped[UUID] = mapped_column(ForeignKey("threat_scenarios.id"), nullable=False)
-    impact_rating_id: Mapped[UUID] = mapped_column(ForeignKey("impact_ratings.id"), nullable=False)
-    attack_feasibility_id: Mapped[UUID] = mapped_column(ForeignKey("attack_feasibilities.id"), nullable=False)
+    threat_scenario_id: Mapped[UUID] = mapped_column(ForeignKey("threat_scenarios.id"), nullable=False, index=True)
+    impact_rating_id: Mapped[UUID] = mapped_column(ForeignKey("impact_ratings.id"), nullable=False, index=True)
+    attack_feasibility_id: Mapped[UUID] = mapped_column(ForeignKey("attack_feasibilities.id"), nullable=False, index=True)
     
     # Risk calculation
     risk_level: Mapped[RiskLevel] = mapped_column(nullable=False)
@@ -63,42 +77,80 @@ class RiskValue(BaseModel):
         
         Reference: data-model.md validation rules
         """
-        if risk_score >= 0.8:
-            return RiskLevel.VERY_HIGH
-        elif risk_score >= 0.6:
-            return RiskLevel.HIGH
-        elif risk_score >= 0.3:
-            return RiskLevel.MEDIUM
-        else:
-            return RiskLevel.LOW
+        return _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, risk_score)]
     
     def validate_risk_calculation(self) -> bool:
         """Validate risk score calculation and level derivation.
         
         Reference: data-model.md validation rules
         """
-        if not (self.impact_rating and self.attack_feasibility):
+        impact_rating = self.impact_rating
+        attack_feasibility = self.attack_feasibility
+        if not (impact_rating and attack_feasibility):
             return False
             
-        expected_score = self.calculate_risk_score()
-        expected_level = self.derive_risk_level_from_score(expected_score)
+        expected_score = round(impact_rating.impact_score * attack_feasibility.feasibility_score, 3)
+        if fabs(self.risk_score - expected_score) >= 0.001:
+            return False
         
-        return (abs(self.risk_score - expected_score) < 0.001 and
-                self.risk_level == expected_level)
+        # Only derive the expected level once the score itself checks out
+        return self.risk_level is self.derive_risk_level_from_score(expected_score)
     
     def validate_referenced_entities_exist(self) -> bool:
         """Validate all referenced entities exist.
         
         Reference: data-model.md validation rules
         """
-        return all([
-            self.asset is not None,
-            self.threat_scenario is not None,
-            self.impact_rating is not None,
-            self.attack_feasibility is not None,
-        ])
+        # Stops at the first missing entity instead of loading all four up front
+        return all(getattr(self, name) is not None for name in _REFERENCED_ENTITIES)
     
     def update_calculated_values(self) -> None:
         """Update risk score and level based on current impact and feasibility."""
-        self.risk_score = self.calculate_risk_score()
-        self.risk_level = self.derive_risk_level_from_score(self.risk_score)
\ No newline at end of file
+        self.risk_score, self.risk_level = self._calculate_score_and_level()
+    
+    def _calculate_score_and_level(self) -> Tuple[float, RiskLevel]:
+        """Calculate risk score and its derived level in one pass."""
+        risk_score = self.calculate_risk_score()
+        return risk_score, _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, risk_score)]
+    
+    @classmethod
+    def bulk_update_calculated_values(
+        cls, session, ids: Iterable[UUID], batch_size: int = 5000
+    ) -> int:
+        """Recalculate score and level for many risk values with batched UPDATEs.
+        
+        Loads the referenced ratings eagerly and writes the results through
+        bulk_update_mappings instead of flushing each dirty instance.
+        Batches are kept well below ~10k rows per statement.
+        
+        Stored scores are not refreshed when a rating changes; call this for
+        the affected risk values after updating impact or feasibility scores.
+        
+        Returns:
+            Number of risk values updated
+        """
+        from sqlalchemy.orm import selectinload
+        
+        ids = list(ids)
+        updated = 0
+        for start in range(0, len(ids), batch_size):
+            risk_values = session.scalars(
+                select(cls)
+                .where(cls.id.in_(ids[start:start + batch_size]))
+                .options(selectinload(cls.impact_rating), selectinload(cls.attack_feasibility))
+            ).all()
+            
+            mappings = []
+            for risk_value in risk_values:
+                risk_score, risk_level = risk_value._calculate_score_and_level()
+                mappings.append({
+                    "id": risk_value.id,
+                    "risk_score": risk_score,
+                    "risk_level": risk_level,
+                })
+            
+            session.bulk_update_mappings(cls, mappings)
+            updated += len(mappings)
+        
+        return updated
+
@@ -4,13 +4,14 @@ Reference: data-model.md lines 34-61 (ThreatScenario entity definition)
 Specific cybersecurity threats applicable to assets.
 """
 
+import re
 from enum import Enum
 from typing import List
 from uuid import UUID
-from sqlalchemy import String, Text, JSON, ForeignKey
+from sqlalchemy import String, Text, ForeignKey, CheckConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import BaseModel
+from .base import BaseModel, JSONType
 
 
 class ThreatActor(Enum):
@@ -21,20 +22,41 @@ class ThreatActor(Enum):
     INSIDER = "INSIDER"
 
 
+# Keywords marking a prerequisite as a verifiable condition (substring match)
+_VERIFIABLE_PREREQUISITE_RE = re.compile(
+    r"access|knowledge|tool|credential|position|time", re.IGNORECASE
+)
+
+# Feasible attack vectors per asset type
+_FEASIBLE_VECTORS = {
+    "HARDWARE": frozenset({"physical_access", "side_channel", "tampering", "fault_injection"}),
+    "SOFTWARE": frozenset({"code_injection", "buffer_overflow", "privilege_escalation", "malware"}),
+    "COMMUNICATION": frozenset({"eavesdropping", "man_in_middle", "replay", "jamming"}),
+    "DATA": frozenset({"unauthorized_access", "data_corruption", "data_theft", "privacy_breach"}),
+}
+
+
 class ThreatScenario(BaseModel):
     """ThreatScenario model representing specific cybersecurity threats."""
     
     __tablename__ = "threat_scenarios"
+    __table_args__ = (
+        # Enforced by the database so bulk inserts are checked without a per-row Python pass
+        CheckConstraint("length(trim(threat_name)) > 0", name="ck_threat_scenarios_threat_name_not_blank"),
+        Index(
+            "ix_threat_scenarios_attack_vectors", "attack_vectors", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Core fields
-    asset_id: Mapped[UUID] = mapped_column(ForeignKey("assets.id"), nullable=False)
+    asset_id: Mapped[UUID] = mapped_column(ForeignKey("assets.id"), nullable=False, index=True)
     threat_name: Mapped[str] = mapped_column(String(255), nullable=False)
     threat_actor: Mapped[ThreatActor] = mapped_column(nullable=False)
     motivation: Mapped[str] = mapped_column(Text, nullable=False)
     
     # JSON fields for complex data
-    attack_vectors: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
-    prerequisites: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
+    attack_vectors: Mapped[List[str]] = mapped_column(JSONType, nullable=False, default=list)
+    prerequisites: Mapped[List[str]] = mapped_column(JSONType, nullable=False, default=list)
     
     # ISO/SAE 21434 traceability
     iso_section: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -59,18 +81,8 @@ class ThreatScenario(BaseModel):
         if not self.asset:
             return False
             
-        asset_type = self.asset.asset_type
-        
-        # Define feasible attack vectors per asset type
-        feasible_vectors = {
-            "HARDWARE": ["physical_access", "side_channel", "tampering", "fault_injection"],
-            "SOFTWARE": ["code_injection", "buffer_overflow", "privilege_escalation", "malware"],
-            "COMMUNICATION": ["eavesdropping", "man_in_middle", "replay", "jamming"],
-            "DATA": ["unauthorized_access", "data_corruption", "data_theft", "privacy_breach"]
-        }
-        
-        asset_vectors = feasible_vectors.get(asset_type.value, [])
-        return all(vector in asset_vectors for vector in self.attack_vectors)
+        asset_vectors = _FEASIBLE_VECTORS.get(self.asset.asset_type.value, frozenset())
+        return asset_vectors.issuperset(self.attack_vectors)
     
     def validate_prerequisites(self) -> bool:
         """Validate prerequisites are verifiable conditions.
@@ -78,9 +90,5 @@ class ThreatScenario(BaseModel):
         Reference: data-model.md validation rules
         """
         # Prerequisites should be specific, measurable conditions
-        verifiable_keywords = ["access", "knowledge", "tool", "credential", "position", "time"]
-        
-        for prereq in self.prerequisites:
-            if not any(keyword in prereq.lower() for keyword in verifiable_keywords):
-                return False
-        return True
\ No newline at end of file
+        search = _VERIFIABLE_PREREQUISITE_RE.search
+        return all(search(prereq) for prereq in self.prerequisites)
\ No newline at end of file
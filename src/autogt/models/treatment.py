@@ -4,13 +4,15 @@ Reference: data-model.md lines 169-195 (RiskTreatment entity definition)
 Mitigation strategy decisions for identified risks.
 """
 
+import re
 from enum import Enum
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from sqlalchemy import String, Text, JSON, Float, ForeignKey
+from sqlalchemy import String, Text, Float, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import BaseModel
+from .base import BaseModel, JSONType
+from .risk import RiskLevel
 
 
 class TreatmentDecision(Enum):
@@ -29,18 +31,52 @@ class ResidualRiskLevel(Enum):
     VERY_HIGH = "VERY_HIGH"
 
 
+# Ordering of original and residual risk levels for residual vs original comparison
+_RISK_LEVEL_ORDER = {
+    RiskLevel.LOW: 1,
+    RiskLevel.MEDIUM: 2,
+    RiskLevel.HIGH: 3,
+    RiskLevel.VERY_HIGH: 4,
+}
+_RESIDUAL_RISK_LEVEL_ORDER = {
+    ResidualRiskLevel.LOW: 1,
+    ResidualRiskLevel.MEDIUM: 2,
+    ResidualRiskLevel.HIGH: 3,
+    ResidualRiskLevel.VERY_HIGH: 4,
+}
+
+# Decisions that must carry a positive implementation cost
+_COST_REQUIRED_DECISIONS = frozenset({TreatmentDecision.REDUCE, TreatmentDecision.TRANSFER})
+
+# Key decision factors expected in the rationale for each decision (case-insensitive substring match)
+_DECISION_KEYWORD_RES = {
+    TreatmentDecision.REDUCE: re.compile(r"mitigate|control|implement|reduce", re.IGNORECASE),
+    TreatmentDecision.TRANSFER: re.compile(r"transfer|share|insurance|third-party", re.IGNORECASE),
+    TreatmentDecision.AVOID: re.compile(r"avoid|eliminate|remove|discontinue", re.IGNORECASE),
+    TreatmentDecision.ACCEPT: re.compile(r"accept|tolerate|justify|acceptable", re.IGNORECASE),
+}
+
+
 class RiskTreatment(BaseModel):
     """RiskTreatment model representing mitigation strategy decisions."""
     
     __tablename__ = "risk_treatments"
+    __table_args__ = (
+        Index(
+            "ix_risk_treatments_countermeasures", "countermeasures", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Core fields
-    risk_value_id: Mapped[UUID] = mapped_column(ForeignKey("risk_values.id"), nullable=False)
+    risk_value_id: Mapped[UUID] = mapped_column(ForeignKey("risk_values.id"), nullable=False, index=True)
     treatment_decision: Mapped[TreatmentDecision] = mapped_column(nullable=False)
     residual_risk_level: Mapped[ResidualRiskLevel] = mapped_column(nullable=False)
+    # Risk level of the treated risk value when the decision was made; empty for
+    # treatments recorded before the column existed
+    original_risk_level: Mapped[Optional[RiskLevel]] = mapped_column(nullable=True)
     
     # Treatment details
-    countermeasures: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
+    countermeasures: Mapped[List[str]] = mapped_column(JSONType, nullable=False, default=list)
     implementation_cost: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     rationale: Mapped[str] = mapped_column(Text, nullable=False)
     
@@ -59,29 +95,28 @@ class RiskTreatment(BaseModel):
     def validate_residual_risk_level(self) -> bool:
         """Validate residual risk must be <= original risk level.
         
+        Compares against the original level recorded on the treatment, so the
+        risk value only has to be loaded for treatments recorded without one.
+        
         Reference: data-model.md validation rules
         """
-        if not self.risk_value:
-            return False
+        original_risk_level = self.original_risk_level
+        if original_risk_level is None:
+            if not self.risk_value:
+                return False
+            original_risk_level = self.risk_value.risk_level
             
-        risk_level_order = {
-            "LOW": 1,
-            "MEDIUM": 2,
-            "HIGH": 3,
-            "VERY_HIGH": 4,
-        }
-        
-        original_level = risk_level_order[self.risk_value.risk_level.value]
-        residual_level = risk_level_order[self.residual_risk_level.value]
-        
-        return residual_level <= original_level
+        return (
+            _RESIDUAL_RISK_LEVEL_ORDER[self.residual_risk_level]
+            <= _RISK_LEVEL_ORDER[original_risk_level]
+        )
     
     def validate_countermeasures_required(self) -> bool:
         """Validate countermeasures required unless decision is ACCEPT.
         
         Reference: data-model.md validation rules
         """
-        if self.treatment_decision == TreatmentDecision.ACCEPT:
+        if self.treatment_decision is TreatmentDecision.ACCEPT:
             return True  # No countermeasures required for acceptance
         return len(self.countermeasures) > 0
     
@@ -90,9 +125,7 @@ class RiskTreatment(BaseModel):
         
         Reference: data-model.md validation rules
         """
-        cost_required_decisions = [TreatmentDecision.REDUCE, TreatmentDecision.TRANSFER]
-        
-        if self.treatment_decision in cost_required_decisions:
+        if self.treatment_decision in _COST_REQUIRED_DECISIONS:
             return self.implementation_cost > 0.0
         return True
     
@@ -102,12 +135,5 @@ class RiskTreatment(BaseModel):
             return False
             
         # Check for key decision factors
-        decision_keywords = {
-            TreatmentDecision.REDUCE: ["mitigate", "control", "implement", "reduce"],
-            TreatmentDecision.TRANSFER: ["transfer", "share", "insurance", "third-party"],
-            TreatmentDecision.AVOID: ["avoid", "eliminate", "remove", "discontinue"],
-            TreatmentDecision.ACCEPT: ["accept", "tolerate", "justify", "acceptable"],
-        }
-        
-        keywords = decision_keywords.get(self.treatment_decision, [])
-        return any(keyword in self.rationale.lower() for keyword in keywords)
\ No newline at end of file
+        keywords = _DECISION_KEYWORD_RES.get(self.treatment_decision)
+        return keywords is not None and keywords.search(self.rationale) is not None
\ No newline at end of file
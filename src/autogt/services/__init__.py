@@ -1,7 +1,63 @@
-"""Services package for AutoGT platform."""
+"""Services package for AutoGT platform.
 
-from .autogen_agent import AutoGenTaraAgent, TaraAgentConfig
-from .file_handler import FileHandler
-from .database import DatabaseService
-from .export import ExportService, ExportConfig, ExportResult, ExportError
-from .tara_processor import TaraProcessor, TaraProcessorConfig, TaraProcessorResult, TaraStep
\ No newline at end of file
+The database service is imported eagerly. The AI agent, file handling,
+export and processor services pull in the AutoGen, pandas and openpyxl
+stacks, so they are imported on first attribute access (PEP 562).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .database import DatabaseService, load_threat_scenarios
+
+if TYPE_CHECKING:
+    from .autogen_agent import AutoGenTaraAgent, TaraAgentConfig
+    from .file_handler import FileHandler
+    from .export import ExportService, ExportConfig, ExportResult, ExportError
+    from .tara_processor import TaraProcessor, TaraProcessorConfig, TaraProcessorResult, TaraStep
+
+# Lazily imported names mapped to the submodule defining them
+_LAZY_IMPORTS = {
+    "AutoGenTaraAgent": ".autogen_agent",
+    "TaraAgentConfig": ".autogen_agent",
+    "FileHandler": ".file_handler",
+    "ExportService": ".export",
+    "ExportConfig": ".export",
+    "ExportResult": ".export",
+    "ExportError": ".export",
+    "TaraProcessor": ".tara_processor",
+    "TaraProcessorConfig": ".tara_processor",
+    "TaraProcessorResult": ".tara_processor",
+    "TaraStep": ".tara_processor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported services on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# Export all services and their configuration/result types
+__all__ = [
+    # AI agent
+    "AutoGenTaraAgent", "TaraAgentConfig",
+    
+    # File and database access
+    "FileHandler", "DatabaseService", "load_threat_scenarios",
+    
+    # Export
+    "ExportService", "ExportConfig", "ExportResult", "ExportError",
+    
+    # TARA workflow
+    "TaraProcessor", "TaraProcessorConfig", "TaraProcessorResult", "TaraStep"
+]
@@ -4,8 +4,12 @@ Reference: research.md AutoGen integration patterns and T032 task
 Provides AI-powered analysis for 8-step automotive cybersecurity workflow.
 """
 
+import copy
+import hashlib
+import inspect
 import logging
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from autogen_ext.models.openai import OpenAIChatCompletionClient
@@ -17,8 +21,68 @@ from autogen_agentchat.messages import TextMessage
 # Setup logger for this module
 logger = logging.getLogger('autogt.services.autogen_agent')
 
+# Operation names accepted by AutoGenTaraAgent.batch, mapped to the method serving each
+_BATCH_OPERATIONS = {
+    "assets": "analyze_assets",
+    "threats": "identify_threats",
+    "paths": "model_attack_paths",
+    "feasibility": "assess_feasibility",
+    "impact": "assess_impact",
+    "risk": "calculate_risk",
+    "treatment": "plan_treatment",
+    "goals": "architect_goals",
+}
 
-@dataclass
+# System message of each specialized agent, in TARA step order
+_AGENT_SYSTEM_MESSAGES = {
+    # Step 1: Asset Definition Agent
+    "asset_analyst": """You are an automotive cybersecurity asset analyst specializing in ISO/SAE 21434.
+            Your role is to analyze vehicle system components and define assets with proper criticality levels.
+            Focus on: asset identification, interface mapping, data flow analysis, and security property classification.
+            Output structured data suitable for database storage.""",
+    
+    # Step 2: Impact Rating Agent
+    "impact_assessor": """You are an automotive cybersecurity impact assessor specializing in ISO/SAE 21434.
+            Your role is to evaluate the potential impact of cybersecurity incidents on safety, financial, operational, and privacy aspects.
+            Rate impacts according to ISO standards and provide quantified impact scores.""",
+    
+    # Step 3: Threat Identification Agent
+    "threat_hunter": """You are an automotive cybersecurity threat hunter specializing in ISO/SAE 21434.
+            Your role is to identify potential threat scenarios, threat actors, attack vectors, and prerequisites.
+            Consider automotive-specific threats including remote attacks, physical access, and supply chain risks.""",
+    
+    # Step 4: Attack Path Modeling Agent
+    "attack_modeler": """You are an automotive cybersecurity attack path modeler specializing in ISO/SAE 21434.
+            Your role is to model detailed attack paths, including step sequences, intermediate targets, technical barriers, and required resources.
+            Focus on realistic attack scenarios relevant to automotive systems.""",
+    
+    # Step 5: Attack Feasibility Agent
+    "feasibility_analyzer": """You are an automotive cybersecurity feasibility analyzer specializing in ISO/SAE 21434.
+            Your role is to assess attack feasibility based on elapsed time, expertise requirements, knowledge of target, window of opportunity, and equipment needs.
+            Provide quantified feasibility scores according to ISO standards.""",
+    
+    # Step 6: Risk Calculation Agent
+    "risk_calculator": """You are an automotive cybersecurity risk calculator specializing in ISO/SAE 21434.
+            Your role is to calculate risk values by combining impact ratings and attack feasibility assessments.
+            Use ISO/SAE 21434 risk matrices and provide quantified risk scores with proper justification.""",
+    
+    # Step 7: Risk Treatment Agent
+    "treatment_planner": """You are an automotive cybersecurity treatment planner specializing in ISO/SAE 21434.
+            Your role is to develop risk treatment strategies including countermeasures, residual risk assessment, and implementation guidance.
+            Consider automotive constraints and provide cost-effective treatment options.""",
+    
+    # Step 8: Goals Definition Agent
+    "goals_architect": """You are a cybersecurity goals architect specializing in ISO/SAE 21434.
+            Your role is to derive specific, measurable cybersecurity goals from risk treatments.
+            Define protection levels, security controls, verification methods, and implementation phases.
+            Ensure goals are achievable, verifiable, and compliant with automotive standards.""",
+}
+
+# Most AI responses kept for reuse; the least recently used entry is evicted first
+_RESPONSE_CACHE_SIZE = 128
+
+
+@dataclass(slots=True)
 class TaraAgentConfig:
     """Configuration for TARA agent setup."""
     gemini_api_key: str
@@ -72,86 +136,23 @@ class AutoGenTaraAgent:
         
         # Setup specialized agents for 8-step TARA process
         self.agents = self._setup_tara_agents()
+        
+        # Parsed AI responses keyed by a hash of model and prompt, reused for identical
+        # requests. In memory only: it dedupes requests within this process and is
+        # lost when the process exits.
+        self._response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     def _setup_tara_agents(self) -> Dict[str, AssistantAgent]:
         """Create specialized agents for each TARA step."""
-        agents = {}
-        
-        # Step 1: Asset Definition Agent
-        agents["asset_analyst"] = AssistantAgent(
-            name="asset_analyst",
-            model_client=self.client,
-            system_message="""You are an automotive cybersecurity asset analyst specializing in ISO/SAE 21434.
-            Your role is to analyze vehicle system components and define assets with proper criticality levels.
-            Focus on: asset identification, interface mapping, data flow analysis, and security property classification.
-            Output structured data suitable for database storage.""",
-        )
-        
-        # Step 2: Impact Rating Agent
-        agents["impact_assessor"] = AssistantAgent(
-            name="impact_assessor",
-            model_client=self.client,
-            system_message="""You are an automotive cybersecurity impact assessor specializing in ISO/SAE 21434.
-            Your role is to evaluate the potential impact of cybersecurity incidents on safety, financial, operational, and privacy aspects.
-            Rate impacts according to ISO standards and provide quantified impact scores.""",
-        )
-        
-        # Step 3: Threat Identification Agent
-        agents["threat_hunter"] = AssistantAgent(
-            name="threat_hunter",
-            model_client=self.client,
-            system_message="""You are an automotive cybersecurity threat hunter specializing in ISO/SAE 21434.
-            Your role is to identify potential threat scenarios, threat actors, attack vectors, and prerequisites.
-            Consider automotive-specific threats including remote attacks, physical access, and supply chain risks.""",
-        )
-        
-        # Step 4: Attack Path Modeling Agent
-        agents["attack_modeler"] = AssistantAgent(
-            name="attack_modeler",
-            model_client=self.client,
-            system_message="""You are an automotive cybersecurity attack path modeler specializing in ISO/SAE 21434.
-            Your role is to model detailed attack paths, including step sequences, intermediate targets, technical barriers, and required resources.
-            Focus on realistic attack scenarios relevant to automotive systems.""",
-        )
-        
-        # Step 5: Attack Feasibility Agent
-        agents["feasibility_analyzer"] = AssistantAgent(
-            name="feasibility_analyzer",
-            model_client=self.client,
-            system_message="""You are an automotive cybersecurity feasibility analyzer specializing in ISO/SAE 21434.
-            Your role is to assess attack feasibility based on elapsed time, expertise requirements, knowledge of target, window of opportunity, and equipment needs.
-            Provide quantified feasibility scores according to ISO standards.""",
-        )
-        
-        # Step 6: Risk Calculation Agent
-        agents["risk_calculator"] = AssistantAgent(
-            name="risk_calculator",
-            model_client=self.client,
-            system_message="""You are an automotive cybersecurity risk calculator specializing in ISO/SAE 21434.
-            Your role is to calculate risk values by combining impact ratings and attack feasibility assessments.
-            Use ISO/SAE 21434 risk matrices and provide quantified risk scores with proper justification.""",
-        )
-        
-        # Step 7: Risk Treatment Agent
-        agents["treatment_planner"] = AssistantAgent(
-            name="treatment_planner",
-            model_client=self.client,
-            system_message="""You are an automotive cybersecurity treatment planner specializing in ISO/SAE 21434.
-            Your role is to develop risk treatment strategies including countermeasures, residual risk assessment, and implementation guidance.
-            Consider automotive constraints and provide cost-effective treatment options.""",
-        )
-        
-        # Step 8: Goals Definition Agent
-        agents["goals_architect"] = AssistantAgent(
-            name="goals_architect",
+        return {name: self._create_agent(name) for name in _AGENT_SYSTEM_MESSAGES}
+    
+    def _create_agent(self, name: str) -> AssistantAgent:
+        """Create a specialized agent with its own, empty model context."""
+        return AssistantAgent(
+            name=name,
             model_client=self.client,
-            system_message="""You are a cybersecurity goals architect specializing in ISO/SAE 21434.
-            Your role is to derive specific, measurable cybersecurity goals from risk treatments.
-            Define protection levels, security controls, verification methods, and implementation phases.
-            Ensure goals are achievable, verifiable, and compliant with automotive standards.""",
+            system_message=_AGENT_SYSTEM_MESSAGES[name],
         )
-        
-        return agents
     
     def analyze_assets(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze and identify assets using AI agent."""
@@ -192,6 +193,9 @@ class AutoGenTaraAgent:
     async def identify_threats(self, context: Dict[str, Any], max_retries: int = 3) -> Dict[str, Any]:
         """Identify threat scenarios for assets using real AI API with retry mechanism.
         
+        Identical requests made earlier by this process are answered from a
+        bounded in-memory cache instead of calling the API again.
+        
         Args:
             context: Analysis context containing asset information
             max_retries: Maximum number of retry attempts (default: 3)
@@ -205,7 +209,9 @@ class AutoGenTaraAgent:
         import asyncio
         import json
         
-        agent = self.agents["threat_hunter"]
+        # An agent keeps every message it has seen in its model context, so a shared
+        # agent would mix the prompts of concurrent requests; use one per request
+        agent = self._create_agent("threat_hunter")
         
         # Create detailed task message
         task_message = f"""
@@ -243,8 +249,19 @@ class AutoGenTaraAgent:
         Provide at least 2-3 realistic threat scenarios. Focus on automotive-specific threats.
         """
         
+        # The prompt embeds every input, so model + prompt identifies the request
+        cache_key = hashlib.sha256(f"{self.config.model_name}\n{task_message}".encode()).hexdigest()
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            logger.info(f"♻️ Reusing cached AI response for asset: {context.get('asset_name')}")
+            # Callers own the returned dict, so never hand out the cached one
+            return copy.deepcopy(cached)
+        
         logger.info(f"🔄 Sending AI request for asset: {context.get('asset_name')}")
-        logger.debug(f"📤 AI Request Context: {json.dumps(context, indent=2)}")
+        # Only pretty-print the context when debug output will actually be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📤 AI Request Context: %s", json.dumps(context, indent=2))
         
         # Retry loop
         last_error = None
@@ -265,7 +282,7 @@ class AutoGenTaraAgent:
                 response = await agent.on_messages([message], cancellation_token=None)
                 
                 logger.info(f"✅ Received AI response")
-                logger.debug(f"📥 Raw AI Response: {response}")
+                logger.debug("📥 Raw AI Response: %s", response)
                 
                 # Extract content from response
                 if hasattr(response, 'chat_message'):
@@ -275,7 +292,7 @@ class AutoGenTaraAgent:
                 else:
                     response_text = str(response)
                 
-                logger.debug(f"📄 Response text: {response_text[:500]}...")
+                logger.debug("📄 Response text: %.500s...", response_text)
                 
                 # Parse JSON response
                 # Try to extract JSON from markdown code blocks if present
@@ -291,7 +308,10 @@ class AutoGenTaraAgent:
                 result = json.loads(response_text)
                 logger.info(f"✅ Successfully parsed {len(result.get('threats', []))} threats from AI")
                 
-                # Success! Return the result
+                # Success! Cache a private copy and return the result
+                self._response_cache[cache_key] = copy.deepcopy(result)
+                if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
                 return result
                 
             except json.JSONDecodeError as e:
@@ -402,6 +422,35 @@ class AutoGenTaraAgent:
             ]
         }
     
+    async def batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Run several agent operations as one batch, returning results in call order.
+        
+        Operations backed by a model round-trip are awaited concurrently, so the
+        batch costs roughly one request latency instead of one per call.
+        
+        Args:
+            calls: (operation, context) pairs; operation is a key of _BATCH_OPERATIONS
+            
+        Returns:
+            One result dictionary per call
+            
+        Raises:
+            TaraAgentError: If an operation name is unknown
+        """
+        import asyncio
+        
+        # Validate every operation first so no coroutine is left un-awaited
+        unknown = [operation for operation, _ in calls if operation not in _BATCH_OPERATIONS]
+        if unknown:
+            raise TaraAgentError(f"Unknown batch operation: {unknown[0]}")
+        
+        results = [getattr(self, _BATCH_OPERATIONS[operation])(context) for operation, context in calls]
+        
+        pending = [index for index, result in enumerate(results) if inspect.isawaitable(result)]
+        for index, result in zip(pending, await asyncio.gather(*(results[i] for i in pending))):
+            results[index] = result
+        return results
+    
     def get_model_client(self) -> OpenAIChatCompletionClient:
         """Get the underlying model client."""
         return self.client
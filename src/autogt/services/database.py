@@ -5,7 +5,7 @@ Provides session management, connection pooling, and migration support.
 """
 
 import os
-from typing import Generator, Optional, Dict, Any
+from typing import Generator, Optional, Dict, Any, List
 from contextlib import contextmanager
 from sqlalchemy import create_engine, Engine, event
 from sqlalchemy.orm import sessionmaker, Session
@@ -14,10 +14,26 @@ import logging
 
 from ..models import Base
 
+try:
+    import orjson
+except ImportError:  # Optional dependency; fall back to the stdlib json codec
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
 
+def _json_engine_options() -> Dict[str, Any]:
+    """JSON column codec options for create_engine (orjson when installed)."""
+    if orjson is None:
+        return {}
+    return {
+        # Non-string keys are stringified, matching the stdlib json behaviour
+        "json_serializer": lambda value: orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode(),
+        "json_deserializer": orjson.loads,
+    }
+
+
 class DatabaseError(Exception):
     """Custom exception for database operations."""
     pass
@@ -78,7 +94,8 @@ class DatabaseService:
                         "check_same_thread": False,
                         "timeout": 30
                     },
-                    echo=os.getenv('SQL_DEBUG', '').lower() == 'true'
+                    echo=os.getenv('SQL_DEBUG', '').lower() == 'true',
+                    **_json_engine_options()
                 )
                 
                 # Enable foreign key constraints for SQLite
@@ -96,7 +113,8 @@ class DatabaseService:
                     max_overflow=10,
                     pool_pre_ping=True,
                     pool_recycle=3600,  # 1 hour
-                    echo=os.getenv('SQL_DEBUG', '').lower() == 'true'
+                    echo=os.getenv('SQL_DEBUG', '').lower() == 'true',
+                    **_json_engine_options()
                 )
             
             logger.info(f"Database engine created for: {self.database_url.split('://')[0]}")
@@ -304,4 +322,30 @@ def initialize_database(database_url: Optional[str] = None) -> DatabaseService:
     """
     global _db_service
     _db_service = DatabaseService(database_url)
-    return _db_service
\ No newline at end of file
+    return _db_service
+
+
+def load_threat_scenarios(session: Session, analysis_id: Any, *options: Any) -> List["ThreatScenario"]:
+    """Load the threat scenarios of an analysis with an explicit loading plan.
+    
+    Each scenario's asset is loaded with one SELECT ... IN query; any further
+    relationships must be requested through ``options``. All other
+    relationships raise on access instead of silently issuing a query per
+    scenario.
+    
+    Args:
+        session: Active database session
+        analysis_id: Analysis whose threat scenarios are loaded
+        *options: Additional loader options, e.g. selectinload(ThreatScenario.attack_paths)
+        
+    Returns:
+        List of ThreatScenario instances
+    """
+    from sqlalchemy.orm import raiseload, selectinload
+    from ..models import Asset, ThreatScenario
+    
+    return session.query(ThreatScenario).join(Asset).filter(
+        Asset.analysis_id == analysis_id
+    ).options(
+        selectinload(ThreatScenario.asset), *options, raiseload("*")
+    ).all()
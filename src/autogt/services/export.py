@@ -20,7 +20,7 @@ from ..models import TaraAnalysis
 from .database import DatabaseService
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportConfig:
     """Configuration for export operations."""
     include_metadata: bool = True
@@ -30,7 +30,7 @@ class ExportConfig:
     output_directory: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportResult:
     """Result of export operation."""
     success: bool
@@ -45,6 +45,19 @@ class ExportError(Exception):
     pass
 
 
+# Enum-typed columns emitted by the basic JSON export, in output order
+_ASSET_ENUM_FIELDS = ("asset_type", "criticality_level")
+_GOAL_ENUM_FIELDS = ("protection_level", "implementation_phase")
+
+# Timestamp suffix used for generated export filenames
+_FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def _enum_values(instance, fields) -> Dict[str, Any]:
+    """Map enum-typed fields of a model instance to their values (None if unset)."""
+    return {name: getattr(getattr(instance, name), "value", None) for name in fields}
+
+
 class ExportService:
     """Export service for generating JSON and Excel outputs.
     
@@ -88,7 +101,7 @@ class ExportService:
             
             # Determine output path
             if not file_path:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = datetime.now().strftime(_FILENAME_TIMESTAMP_FORMAT)
                 file_path = self.output_directory / f"tara_analysis_{analysis_id[:8]}_{timestamp}.json"
             
             file_path = Path(file_path)
@@ -128,7 +141,7 @@ class ExportService:
             
             # Determine output path
             if not file_path:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = datetime.now().strftime(_FILENAME_TIMESTAMP_FORMAT)
                 file_path = self.output_directory / f"tara_analysis_{analysis_id[:8]}_{timestamp}.xlsx"
             
             file_path = Path(file_path)
@@ -163,7 +176,7 @@ class ExportService:
         with self.db_service.get_session() as session:
             # Load analysis with all relationships
             from ..models import TaraAnalysis
-            from sqlalchemy.orm import selectinload
+            from sqlalchemy.orm import selectinload, raiseload
             from sqlalchemy import func
             
             # Convert partial ID to full UUID if needed
@@ -186,16 +199,19 @@ class ExportService:
                 else:
                     full_analysis_id = str(partial_matches[0].id)
             
-            # Query just the basic analysis first
-            analysis = session.query(TaraAnalysis).filter(TaraAnalysis.id == full_analysis_id).first()
+            # Load the analysis with its assets and goals in one SELECT ... IN each;
+            # any other relationship access raises instead of lazy loading per row
+            analysis = session.query(TaraAnalysis).options(
+                selectinload(TaraAnalysis.assets),
+                selectinload(TaraAnalysis.cybersecurity_goals),
+                raiseload("*"),
+            ).filter(TaraAnalysis.id == full_analysis_id).first()
             
             if not analysis:
                 raise ExportError(f"Analysis not found: {analysis_id}")
             
-            # Count related entities separately to avoid relationship loading issues
-            from ..models import Asset, CybersecurityGoal
-            asset_count = session.query(Asset).filter(Asset.analysis_id == full_analysis_id).count()
-            goal_count = session.query(CybersecurityGoal).filter(CybersecurityGoal.analysis_id == full_analysis_id).count()
+            assets = analysis.assets
+            goals = analysis.cybersecurity_goals
             
             # Build basic JSON structure without complex relationships
             json_data = {
@@ -212,8 +228,8 @@ class ExportService:
                     "iso_section": analysis.iso_section if self.config.include_iso_sections else None,
                 },
                 "statistics": {
-                    "total_assets": asset_count,
-                    "total_goals": goal_count,
+                    "total_assets": len(assets),
+                    "total_goals": len(goals),
                 },
                 "assets": [],
                 "cybersecurity_goals": [],
@@ -225,30 +241,20 @@ class ExportService:
                 }
             }
             
-            # Try to load assets without complex relationships
+            # Serialize assets without complex relationships
             try:
-                assets = session.query(Asset).filter(Asset.analysis_id == full_analysis_id).all()
                 for asset in assets:
-                    asset_data = {
-                        "id": str(asset.id),
-                        "name": asset.name,
-                        "asset_type": asset.asset_type.value if asset.asset_type else None,
-                        "criticality_level": asset.criticality_level.value if asset.criticality_level else None
-                    }
+                    asset_data = {"id": str(asset.id), "name": asset.name}
+                    asset_data.update(_enum_values(asset, _ASSET_ENUM_FIELDS))
                     json_data["assets"].append(asset_data)
             except Exception as e:
                 json_data["assets"] = [{"error": f"Could not load assets: {e}"}]
             
-            # Try to load cybersecurity goals without complex relationships  
+            # Serialize cybersecurity goals without complex relationships  
             try:
-                goals = session.query(CybersecurityGoal).filter(CybersecurityGoal.analysis_id == full_analysis_id).all()
                 for goal in goals:
-                    goal_data = {
-                        "id": str(goal.id),
-                        "goal_name": goal.goal_name,
-                        "protection_level": goal.protection_level.value if goal.protection_level else None,
-                        "implementation_phase": goal.implementation_phase.value if goal.implementation_phase else None
-                    }
+                    goal_data = {"id": str(goal.id), "goal_name": goal.goal_name}
+                    goal_data.update(_enum_values(goal, _GOAL_ENUM_FIELDS))
                     json_data["cybersecurity_goals"].append(goal_data)
             except Exception as e:
                 json_data["cybersecurity_goals"] = [{"error": f"Could not load goals: {e}"}]
@@ -493,6 +499,7 @@ class ExportService:
     
     def _serialize_attack_path(self, path) -> Dict[str, Any]:
         """Serialize attack path model to dictionary."""
+        attack_feasibility = path.attack_feasibility
         return {
             "id": str(path.id),
             "step_sequence": path.step_sequence,
@@ -500,7 +507,7 @@ class ExportService:
             "intermediate_targets": path.intermediate_targets,
             "technical_barriers": path.technical_barriers,
             "required_resources": path.required_resources,
-            "attack_feasibility": self._serialize_attack_feasibility(path.attack_feasibility) if path.attack_feasibility else None
+            "attack_feasibility": self._serialize_attack_feasibility(attack_feasibility) if attack_feasibility else None
         }
     
     def _serialize_attack_feasibility(self, feasibility) -> Dict[str, Any]:
@@ -529,15 +536,20 @@ class ExportService:
     
     def _serialize_risk_value(self, risk) -> Dict[str, Any]:
         """Serialize risk value model to dictionary."""
+        # Resolve each relationship once; every access goes through the ORM descriptor
+        impact_rating = risk.impact_rating
+        attack_feasibility = risk.attack_feasibility
+        threat_scenario = risk.threat_scenario
+        risk_treatment = risk.risk_treatment
         return {
             "id": str(risk.id),
             "risk_level": risk.risk_level.value,
             "risk_score": risk.risk_score,
             "calculation_method": risk.calculation_method,
-            "impact_score": risk.impact_rating.impact_score if risk.impact_rating else None,
-            "feasibility_score": risk.attack_feasibility.feasibility_score if risk.attack_feasibility else None,
-            "threat_scenario_name": risk.threat_scenario.threat_name if risk.threat_scenario else None,
-            "risk_treatment": self._serialize_risk_treatment(risk.risk_treatment) if risk.risk_treatment else None
+            "impact_score": impact_rating.impact_score if impact_rating else None,
+            "feasibility_score": attack_feasibility.feasibility_score if attack_feasibility else None,
+            "threat_scenario_name": threat_scenario.threat_name if threat_scenario else None,
+            "risk_treatment": self._serialize_risk_treatment(risk_treatment) if risk_treatment else None
         }
     
     def _serialize_risk_treatment(self, treatment) -> Dict[str, Any]:
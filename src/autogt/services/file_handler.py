@@ -15,7 +15,7 @@ import pandas as pd
 from openpyxl import load_workbook
 
 
-@dataclass
+@dataclass(slots=True)
 class FileValidationResult:
     """Result of file validation."""
     is_valid: bool
@@ -24,7 +24,7 @@ class FileValidationResult:
     error_message: Optional[str] = None
 
 
-@dataclass 
+@dataclass(slots=True)
 class ParsedFileData:
     """Parsed file data with metadata."""
     data: Union[Dict[str, Any], List[Dict[str, Any]]]
@@ -57,6 +57,13 @@ class FileHandler:
         'text': ['.txt', '.md']
     }
     
+    # Format name per extension, for constant-time detection
+    _FORMAT_BY_EXTENSION = {
+        extension: format_name
+        for format_name, extensions in SUPPORTED_FORMATS.items()
+        for extension in extensions
+    }
+    
     def __init__(self):
         """Initialize file handler."""
         self._setup_mime_types()
@@ -127,11 +134,7 @@ class FileHandler:
         extension = file_path.suffix.lower()
         
         # Check against supported formats
-        for format_name, extensions in self.SUPPORTED_FORMATS.items():
-            if extension in extensions:
-                return format_name
-        
-        return None
+        return self._FORMAT_BY_EXTENSION.get(extension)
     
     def parse_file(self, file_path: Union[str, Path]) -> ParsedFileData:
         """Parse file and return structured data.
@@ -187,17 +190,18 @@ class FileHandler:
         except Exception as e:
             # Try with openpyxl directly for more control
             try:
-                workbook = load_workbook(file_path, data_only=True)
-                sheet = workbook.active
-                
-                # Get headers from first row
-                headers = [cell.value for cell in sheet[1]]
-                
-                # Get data rows
-                data = []
-                for row in sheet.iter_rows(min_row=2, values_only=True):
-                    row_dict = dict(zip(headers, row))
-                    data.append(row_dict)
+                # Read-only mode streams rows instead of building every cell object
+                workbook = load_workbook(file_path, read_only=True, data_only=True)
+                try:
+                    rows = workbook.active.iter_rows(values_only=True)
+                    
+                    # Get headers from first row
+                    headers = list(next(rows, ()))
+                    
+                    # Get data rows
+                    data = [dict(zip(headers, row)) for row in rows]
+                finally:
+                    workbook.close()
                 
                 return ParsedFileData(
                     data=data,
@@ -273,13 +277,14 @@ class FileHandler:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # Split into lines and create simple structure
-            lines = [line.strip() for line in content.split('\n') if line.strip()]
+            # Split into lines and create simple structure (each line stripped once)
+            stripped = (line.strip() for line in content.split('\n'))
+            lines = [line for line in stripped if line]
             
             # Create list of dictionaries with line numbers
             data = [
-                {'line_number': i + 1, 'content': line}
-                for i, line in enumerate(lines)
+                {'line_number': number, 'content': line}
+                for number, line in enumerate(lines, 1)
             ]
             
             return ParsedFileData(
@@ -334,7 +339,4 @@ class FileHandler:
     
     def get_supported_extensions(self) -> List[str]:
         """Get list of all supported file extensions."""
-        extensions = []
-        for format_extensions in self.SUPPORTED_FORMATS.values():
-            extensions.extend(format_extensions)
-        return sorted(extensions)
\ No newline at end of file
+        return sorted(self._FORMAT_BY_EXTENSION)
\ No newline at end of file
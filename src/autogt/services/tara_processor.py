@@ -9,6 +9,8 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import json
 
 from ..models import (
@@ -18,8 +20,9 @@ from ..models import (
     ThreatActor, RiskLevel, TreatmentDecision, ProtectionLevel,
     ImplementationPhase
 )
+from ..models.analysis import _FINISHED_STATUSES
 from .autogen_agent import AutoGenTaraAgent, TaraAgentConfig
-from .database import DatabaseService
+from .database import DatabaseService, load_threat_scenarios
 from .file_handler import FileHandler
 
 
@@ -35,7 +38,46 @@ class TaraStep(Enum):
     CYBERSECURITY_GOALS = "cybersecurity_goals"
 
 
-@dataclass
+# Steps whose output each step reads; steps with no path between them can run together
+_STEP_DEPENDENCIES = {
+    TaraStep.ASSET_IDENTIFICATION: frozenset(),
+    TaraStep.THREAT_SCENARIO_IDENTIFICATION: frozenset({TaraStep.ASSET_IDENTIFICATION}),
+    TaraStep.ATTACK_PATH_ANALYSIS: frozenset({TaraStep.THREAT_SCENARIO_IDENTIFICATION}),
+    TaraStep.ATTACK_FEASIBILITY_RATING: frozenset({TaraStep.ATTACK_PATH_ANALYSIS}),
+    TaraStep.IMPACT_RATING: frozenset({TaraStep.ASSET_IDENTIFICATION}),
+    TaraStep.RISK_VALUE_DETERMINATION: frozenset({
+        TaraStep.ATTACK_FEASIBILITY_RATING, TaraStep.IMPACT_RATING
+    }),
+    TaraStep.RISK_TREATMENT_DECISION: frozenset({TaraStep.RISK_VALUE_DETERMINATION}),
+    TaraStep.CYBERSECURITY_GOALS: frozenset({TaraStep.RISK_TREATMENT_DECISION}),
+}
+
+
+def _dependency_layers(steps: List[TaraStep]) -> List[List[TaraStep]]:
+    """Group steps into layers whose dependencies all lie in earlier layers.
+    
+    Kahn-style topological sort; steps keep their sequence order within a layer.
+    """
+    layers = []
+    done = set()
+    remaining = list(steps)
+    while remaining:
+        layer = [step for step in remaining if _STEP_DEPENDENCIES[step] <= done]
+        if not layer:
+            raise TaraProcessorError(f"Cyclic step dependencies: {remaining}")
+        layers.append(layer)
+        done.update(layer)
+        remaining = [step for step in remaining if step not in done]
+    return layers
+
+
+@lru_cache(maxsize=None)
+def _coerce_enum(enum_cls: type, value: Any) -> Enum:
+    """Coerce a raw agent value to an enum member, memoized per distinct value."""
+    return enum_cls(value)
+
+
+@dataclass(slots=True)
 class TaraProcessorConfig:
     """Configuration for TARA processor."""
     batch_size: int = 10
@@ -47,7 +89,7 @@ class TaraProcessorConfig:
     performance_tracking: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of a single TARA step."""
     step: TaraStep
@@ -60,7 +102,7 @@ class StepResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaraProcessorResult:
     """Result of complete TARA processing."""
     analysis_id: str
@@ -120,6 +162,12 @@ class TaraProcessor:
             TaraStep.RISK_TREATMENT_DECISION,
             TaraStep.CYBERSECURITY_GOALS
         ]
+        
+        # Independent steps (e.g. impact rating vs. threat identification) share a layer
+        self.step_layers = _dependency_layers(self.step_sequence)
+        
+        # Agent context per asset id, built once per processing run
+        self._asset_contexts: Dict[Any, Dict[str, Any]] = {}
     
     def process_analysis(self, analysis_id: str) -> TaraProcessorResult:
         """Execute complete TARA analysis workflow.
@@ -139,20 +187,20 @@ class TaraProcessor:
             
             # Load analysis
             analysis = self._load_analysis(analysis_id)
-            
-            # Execute each step in sequence
-            for step in self.step_sequence:
-                self.logger.info(f"Executing step: {step.value}")
-                
-                step_result = self._execute_step(analysis, step)
-                step_results.append(step_result)
+            self._asset_contexts.clear()
+            
+            # Execute each layer in turn, the steps of a layer concurrently
+            for layer in self._execution_layers():
+                for step_result in self._execute_layer(analysis, layer):
+                    step_results.append(step_result)
+                    if step_result.success:
+                        steps_completed.append(step_result.step)
+                self._update_analysis_progress(analysis, steps_completed)
                 
-                if step_result.success:
-                    steps_completed.append(step)
-                    self._update_analysis_progress(analysis, step)
-                else:
+                failed = next((result for result in step_results if not result.success), None)
+                if failed is not None:
                     # Stop on first failure unless configured otherwise
-                    error_msg = f"Step {step.value} failed: {step_result.error_message}"
+                    error_msg = f"Step {failed.step.value} failed: {failed.error_message}"
                     self.logger.error(error_msg)
                     
                     return TaraProcessorResult(
@@ -165,10 +213,12 @@ class TaraProcessor:
                         error_message=error_msg
                     )
             
-            # Mark analysis as completed
-            self._finalize_analysis(analysis)
+            # Mark analysis as completed; the stored completion time and the
+            # reported duration share one clock reading
+            completed_at = datetime.now()
+            self._finalize_analysis(analysis, completed_at)
             
-            total_time = (datetime.now() - start_time).total_seconds()
+            total_time = (completed_at - start_time).total_seconds()
             
             return TaraProcessorResult(
                 analysis_id=analysis_id,
@@ -231,6 +281,34 @@ class TaraProcessor:
                 error_message=error_msg
             )
     
+    def _execution_layers(self) -> List[List[TaraStep]]:
+        """Layers of steps to execute, in order.
+        
+        Dependency layers are used only when parallel processing is enabled and
+        the database is not SQLite, whose engine shares a single connection.
+        Otherwise every step is its own layer, in step sequence order.
+        """
+        if (
+            self.config.enable_parallel_processing
+            and self.db_service.engine.dialect.name != "sqlite"
+        ):
+            return self.step_layers
+        return [[step] for step in self.step_sequence]
+    
+    def _execute_layer(self, analysis: TaraAnalysis, layer: List[TaraStep]) -> List[StepResult]:
+        """Execute one layer, returning results in step sequence order.
+        
+        Steps of a multi-step layer run on worker threads.
+        """
+        for step in layer:
+            self.logger.info(f"Executing step: {step.value}")
+        
+        if len(layer) == 1:
+            return [self._execute_step(analysis, layer[0])]
+        
+        with ThreadPoolExecutor(max_workers=len(layer)) as executor:
+            return list(executor.map(lambda step: self._execute_step(analysis, step), layer))
+    
     def _execute_step(self, analysis: TaraAnalysis, step: TaraStep) -> StepResult:
         """Execute a single TARA step.
         
@@ -245,21 +323,21 @@ class TaraProcessor:
         
         try:
             # Route to appropriate step handler
-            if step == TaraStep.ASSET_IDENTIFICATION:
+            if step is TaraStep.ASSET_IDENTIFICATION:
                 return self._execute_asset_identification(analysis, start_time)
-            elif step == TaraStep.THREAT_SCENARIO_IDENTIFICATION:
+            elif step is TaraStep.THREAT_SCENARIO_IDENTIFICATION:
                 return self._execute_threat_identification(analysis, start_time)
-            elif step == TaraStep.ATTACK_PATH_ANALYSIS:
+            elif step is TaraStep.ATTACK_PATH_ANALYSIS:
                 return self._execute_attack_path_analysis(analysis, start_time)
-            elif step == TaraStep.ATTACK_FEASIBILITY_RATING:
+            elif step is TaraStep.ATTACK_FEASIBILITY_RATING:
                 return self._execute_feasibility_rating(analysis, start_time)
-            elif step == TaraStep.IMPACT_RATING:
+            elif step is TaraStep.IMPACT_RATING:
                 return self._execute_impact_rating(analysis, start_time)
-            elif step == TaraStep.RISK_VALUE_DETERMINATION:
+            elif step is TaraStep.RISK_VALUE_DETERMINATION:
                 return self._execute_risk_determination(analysis, start_time)
-            elif step == TaraStep.RISK_TREATMENT_DECISION:
+            elif step is TaraStep.RISK_TREATMENT_DECISION:
                 return self._execute_risk_treatment(analysis, start_time)
-            elif step == TaraStep.CYBERSECURITY_GOALS:
+            elif step is TaraStep.CYBERSECURITY_GOALS:
                 return self._execute_cybersecurity_goals(analysis, start_time)
             else:
                 raise TaraProcessorError(f"Unknown step: {step}")
@@ -320,31 +398,29 @@ class TaraProcessor:
         items_created = 0
         
         with self.db_service.get_session() as session:
+            # Threats have no dependents within this step, so insert them in one batch
+            threat_mappings = []
+            
             # Process each asset
             for asset in analysis.assets:
-                context = {
-                    "asset_name": asset.name,
-                    "asset_type": asset.asset_type.value,
-                    "criticality": asset.criticality_level.value,
-                    "interfaces": asset.interfaces,
-                    "data_flows": asset.data_flows
-                }
-                
                 # Use AutoGen threat hunter
-                agent_result = self.autogen_agent.identify_threats(context)
+                agent_result = self.autogen_agent.identify_threats(self._asset_context(asset))
                 
-                for threat_data in agent_result.get("threats", []):
-                    threat = ThreatScenario(
-                        asset_id=asset.id,
-                        threat_name=threat_data["name"],
-                        threat_actor=ThreatActor(threat_data["actor"]),
-                        motivation=threat_data.get("motivation", ""),
-                        attack_vectors=threat_data.get("attack_vectors", []),
-                        prerequisites=threat_data.get("prerequisites", []),
-                        iso_section=threat_data.get("iso_section", "15.7")
-                    )
-                    session.add(threat)
-                    items_created += 1
+                threat_mappings.extend(
+                    {
+                        "asset_id": asset.id,
+                        "threat_name": threat_data["name"],
+                        "threat_actor": _coerce_enum(ThreatActor, threat_data["actor"]),
+                        "motivation": threat_data.get("motivation", ""),
+                        "attack_vectors": threat_data.get("attack_vectors", []),
+                        "prerequisites": threat_data.get("prerequisites", []),
+                        "iso_section": threat_data.get("iso_section", "15.7"),
+                    }
+                    for threat_data in agent_result.get("threats", [])
+                )
+            
+            session.bulk_insert_mappings(ThreatScenario, threat_mappings)
+            items_created = len(threat_mappings)
             
             session.commit()
         
@@ -364,35 +440,30 @@ class TaraProcessor:
         
         with self.db_service.get_session() as session:
             # Get all threat scenarios
-            from sqlalchemy.orm import selectinload
-            
-            updated_analysis = session.query(TaraAnalysis).options(
-                selectinload(TaraAnalysis.assets).selectinload(Asset.threat_scenarios)
-            ).filter(TaraAnalysis.id == analysis.id).first()
+            threat_scenarios = load_threat_scenarios(session, analysis.id)
             
-            for asset in updated_analysis.assets:
-                for threat in asset.threat_scenarios:
-                    context = {
-                        "asset_name": asset.name,
-                        "threat_name": threat.threat_name,
-                        "attack_vectors": threat.attack_vectors,
-                        "prerequisites": threat.prerequisites
-                    }
-                    
-                    # Use AutoGen attack modeler
-                    agent_result = self.autogen_agent.model_attack_paths(context)
-                    
-                    for path_data in agent_result.get("attack_paths", []):
-                        attack_path = AttackPath(
-                            threat_scenario_id=threat.id,
-                            step_sequence=path_data["sequence"],
-                            attack_step=path_data["step"],
-                            intermediate_targets=path_data.get("targets", []),
-                            technical_barriers=path_data.get("barriers", []),
-                            required_resources=path_data.get("resources", [])
-                        )
-                        session.add(attack_path)
-                        items_created += 1
+            for threat in threat_scenarios:
+                context = {
+                    "asset_name": threat.asset.name,
+                    "threat_name": threat.threat_name,
+                    "attack_vectors": threat.attack_vectors,
+                    "prerequisites": threat.prerequisites
+                }
+                
+                # Use AutoGen attack modeler
+                agent_result = self.autogen_agent.model_attack_paths(context)
+                
+                for path_data in agent_result.get("attack_paths", []):
+                    attack_path = AttackPath(
+                        threat_scenario_id=threat.id,
+                        step_sequence=path_data["sequence"],
+                        attack_step=path_data["step"],
+                        intermediate_targets=path_data.get("targets", []),
+                        technical_barriers=path_data.get("barriers", []),
+                        required_resources=path_data.get("resources", [])
+                    )
+                    session.add(attack_path)
+                    items_created += 1
             
             session.commit()
         
@@ -402,7 +473,7 @@ class TaraProcessor:
             step=TaraStep.ATTACK_PATH_ANALYSIS,
             success=True,
             execution_time_seconds=execution_time,
-            items_processed=sum(len(asset.threat_scenarios) for asset in analysis.assets),
+            items_processed=len(threat_scenarios),
             items_created=items_created
         )
     
@@ -414,36 +485,36 @@ class TaraProcessor:
             # Get all attack paths
             from sqlalchemy.orm import selectinload
             
-            updated_analysis = session.query(TaraAnalysis).options(
-                selectinload(TaraAnalysis.assets)
-                .selectinload(Asset.threat_scenarios)
-                .selectinload(ThreatScenario.attack_paths)
-            ).filter(TaraAnalysis.id == analysis.id).first()
+            attack_paths = [
+                path
+                for threat in load_threat_scenarios(
+                    session, analysis.id, selectinload(ThreatScenario.attack_paths)
+                )
+                for path in threat.attack_paths
+            ]
             
-            for asset in updated_analysis.assets:
-                for threat in asset.threat_scenarios:
-                    for path in threat.attack_paths:
-                        context = {
-                            "attack_step": path.attack_step,
-                            "technical_barriers": path.technical_barriers,
-                            "required_resources": path.required_resources
-                        }
-                        
-                        # Use AutoGen feasibility analyzer
-                        agent_result = self.autogen_agent.assess_feasibility(context)
-                        
-                        feasibility_data = agent_result.get("feasibility", {})
-                        feasibility = AttackFeasibility(
-                            attack_path_id=path.id,
-                            elapsed_time=feasibility_data.get("elapsed_time", "HIGH"),
-                            specialist_expertise=feasibility_data.get("specialist_expertise", "EXPERT"),
-                            knowledge_of_target=feasibility_data.get("knowledge_of_target", "LIMITED"),
-                            window_of_opportunity=feasibility_data.get("window_of_opportunity", "MODERATE"),
-                            equipment_required=feasibility_data.get("equipment_required", "SPECIALIZED"),
-                            feasibility_score=feasibility_data.get("score", 50)
-                        )
-                        session.add(feasibility)
-                        items_created += 1
+            for path in attack_paths:
+                context = {
+                    "attack_step": path.attack_step,
+                    "technical_barriers": path.technical_barriers,
+                    "required_resources": path.required_resources
+                }
+                
+                # Use AutoGen feasibility analyzer
+                agent_result = self.autogen_agent.assess_feasibility(context)
+                
+                feasibility_data = agent_result.get("feasibility", {})
+                feasibility = AttackFeasibility(
+                    attack_path_id=path.id,
+                    elapsed_time=feasibility_data.get("elapsed_time", "HIGH"),
+                    specialist_expertise=feasibility_data.get("specialist_expertise", "EXPERT"),
+                    knowledge_of_target=feasibility_data.get("knowledge_of_target", "LIMITED"),
+                    window_of_opportunity=feasibility_data.get("window_of_opportunity", "MODERATE"),
+                    equipment_required=feasibility_data.get("equipment_required", "SPECIALIZED"),
+                    feasibility_score=feasibility_data.get("score", 50)
+                )
+                session.add(feasibility)
+                items_created += 1
             
             session.commit()
         
@@ -453,11 +524,7 @@ class TaraProcessor:
             step=TaraStep.ATTACK_FEASIBILITY_RATING,
             success=True,
             execution_time_seconds=execution_time,
-            items_processed=sum(
-                len(path.attack_paths) 
-                for asset in analysis.assets 
-                for path in asset.threat_scenarios
-            ),
+            items_processed=len(attack_paths),
             items_created=items_created
         )
     
@@ -467,15 +534,8 @@ class TaraProcessor:
         
         with self.db_service.get_session() as session:
             for asset in analysis.assets:
-                context = {
-                    "asset_name": asset.name,
-                    "asset_type": asset.asset_type.value,
-                    "criticality": asset.criticality_level.value,
-                    "security_properties": asset.security_properties
-                }
-                
                 # Use AutoGen impact assessor
-                agent_result = self.autogen_agent.assess_impact(context)
+                agent_result = self.autogen_agent.assess_impact(self._asset_context(asset))
                 
                 impact_data = agent_result.get("impact", {})
                 impact = ImpactRating(
@@ -510,10 +570,19 @@ class TaraProcessor:
             # Load complete data with relationships
             from sqlalchemy.orm import selectinload
             
+            # Each feasibility is fetched with its attack paths in one SELECT ... IN
+            # per level rather than lazily once per path
             updated_analysis = session.query(TaraAnalysis).options(
-                selectinload(TaraAnalysis.assets).selectinload(Asset.threat_scenarios),
+                selectinload(TaraAnalysis.assets)
+                .selectinload(Asset.threat_scenarios)
+                .selectinload(ThreatScenario.attack_paths)
+                .selectinload(AttackPath.attack_feasibility),
                 selectinload(TaraAnalysis.assets).selectinload(Asset.impact_ratings)
             ).filter(TaraAnalysis.id == analysis.id).first()
+            threats_processed = sum(len(asset.threat_scenarios) for asset in updated_analysis.assets)
+            
+            # Risk values have no dependents within this step, so insert them in one batch
+            risk_mappings = []
             
             for asset in updated_analysis.assets:
                 impact_rating = asset.impact_ratings[0] if asset.impact_ratings else None
@@ -537,16 +606,18 @@ class TaraProcessor:
                         agent_result = self.autogen_agent.calculate_risk(context)
                         
                         risk_data = agent_result.get("risk", {})
-                        risk_value = RiskValue(
-                            threat_scenario_id=threat.id,
-                            impact_rating_id=impact_rating.id,
-                            attack_feasibility_id=feasibility.id,
-                            risk_level=RiskLevel(risk_data.get("level", "MEDIUM")),
-                            risk_score=risk_data.get("score", 50),
-                            calculation_method=risk_data.get("method", "ISO/SAE 21434 Matrix")
-                        )
-                        session.add(risk_value)
-                        items_created += 1
+                        risk_mappings.append({
+                            "asset_id": asset.id,
+                            "threat_scenario_id": threat.id,
+                            "impact_rating_id": impact_rating.id,
+                            "attack_feasibility_id": feasibility.id,
+                            "risk_level": _coerce_enum(RiskLevel, risk_data.get("level", "MEDIUM")),
+                            "risk_score": risk_data.get("score", 50),
+                            "calculation_method": risk_data.get("method", "ISO/SAE 21434 Matrix"),
+                        })
+            
+            session.bulk_insert_mappings(RiskValue, risk_mappings)
+            items_created = len(risk_mappings)
             
             session.commit()
         
@@ -556,7 +627,7 @@ class TaraProcessor:
             step=TaraStep.RISK_VALUE_DETERMINATION,
             success=True,
             execution_time_seconds=execution_time,
-            items_processed=sum(len(asset.threat_scenarios) for asset in analysis.assets),
+            items_processed=threats_processed,
             items_created=items_created
         )
     
@@ -568,41 +639,46 @@ class TaraProcessor:
             # Get all risk values
             from sqlalchemy.orm import selectinload
             
-            updated_analysis = session.query(TaraAnalysis).options(
-                selectinload(TaraAnalysis.assets)
-                .selectinload(Asset.threat_scenarios)
-                .selectinload(ThreatScenario.risk_values)
-            ).filter(TaraAnalysis.id == analysis.id).first()
+            risk_values = [
+                (threat, risk_value)
+                for threat in load_threat_scenarios(
+                    session, analysis.id, selectinload(ThreatScenario.risk_values)
+                )
+                for risk_value in threat.risk_values
+            ]
             
-            for asset in updated_analysis.assets:
-                for threat in asset.threat_scenarios:
-                    for risk_value in threat.risk_values:
-                        context = {
-                            "risk_level": risk_value.risk_level.value,
-                            "risk_score": risk_value.risk_score,
-                            "asset_name": asset.name,
-                            "threat_name": threat.threat_name
-                        }
-                        
-                        # Use AutoGen treatment planner
-                        agent_result = self.autogen_agent.plan_treatment(context)
-                        
-                        treatment_data = agent_result.get("treatment", {})
-                        treatment = RiskTreatment(
-                            risk_value_id=risk_value.id,
-                            treatment_decision=TreatmentDecision(
-                                treatment_data.get("decision", "MITIGATE")
-                            ),
-                            countermeasures=treatment_data.get("countermeasures", []),
-                            residual_risk_level=RiskLevel(
-                                treatment_data.get("residual_risk", "LOW")
-                            ),
-                            implementation_cost=treatment_data.get("cost", "MEDIUM"),
-                            rationale=treatment_data.get("rationale", ""),
-                            iso_section=treatment_data.get("iso_section", "15.11")
-                        )
-                        session.add(treatment)
-                        items_created += 1
+            # Treatments have no dependents within this step, so insert them in one batch
+            treatment_mappings = []
+            
+            for threat, risk_value in risk_values:
+                context = {
+                    "risk_level": risk_value.risk_level.value,
+                    "risk_score": risk_value.risk_score,
+                    "asset_name": threat.asset.name,
+                    "threat_name": threat.threat_name
+                }
+                
+                # Use AutoGen treatment planner
+                agent_result = self.autogen_agent.plan_treatment(context)
+                
+                treatment_data = agent_result.get("treatment", {})
+                treatment_mappings.append({
+                    "risk_value_id": risk_value.id,
+                    "treatment_decision": _coerce_enum(
+                        TreatmentDecision, treatment_data.get("decision", "MITIGATE")
+                    ),
+                    "countermeasures": treatment_data.get("countermeasures", []),
+                    "residual_risk_level": _coerce_enum(
+                        RiskLevel, treatment_data.get("residual_risk", "LOW")
+                    ),
+                    "original_risk_level": risk_value.risk_level,
+                    "implementation_cost": treatment_data.get("cost", "MEDIUM"),
+                    "rationale": treatment_data.get("rationale", ""),
+                    "iso_section": treatment_data.get("iso_section", "15.11"),
+                })
+            
+            session.bulk_insert_mappings(RiskTreatment, treatment_mappings)
+            items_created = len(treatment_mappings)
             
             session.commit()
         
@@ -612,11 +688,7 @@ class TaraProcessor:
             step=TaraStep.RISK_TREATMENT_DECISION,
             success=True,
             execution_time_seconds=execution_time,
-            items_processed=sum(
-                len(threat.risk_values) 
-                for asset in analysis.assets 
-                for threat in asset.threat_scenarios
-            ),
+            items_processed=len(risk_values),
             items_created=items_created
         )
     
@@ -636,20 +708,23 @@ class TaraProcessor:
             # Use AutoGen goals architect
             agent_result = self.autogen_agent.architect_goals(context)
             
-            for goal_data in agent_result.get("goals", []):
-                goal = CybersecurityGoal(
-                    analysis_id=analysis.id,
-                    goal_name=goal_data["name"],
-                    protection_level=ProtectionLevel(goal_data.get("protection_level", "CAL1")),
-                    security_controls=goal_data.get("controls", []),
-                    verification_method=goal_data.get("verification", ""),
-                    implementation_phase=ImplementationPhase(
-                        goal_data.get("phase", "DEVELOPMENT")
+            # Goals have no dependents within this step, so insert them in one batch
+            goal_mappings = [
+                {
+                    "analysis_id": analysis.id,
+                    "goal_name": goal_data["name"],
+                    "protection_level": _coerce_enum(ProtectionLevel, goal_data.get("protection_level", "CAL1")),
+                    "security_controls": goal_data.get("controls", []),
+                    "verification_method": goal_data.get("verification", ""),
+                    "implementation_phase": _coerce_enum(
+                        ImplementationPhase, goal_data.get("phase", "DEVELOPMENT")
                     ),
-                    iso_section=goal_data.get("iso_section", "15.5")
-                )
-                session.add(goal)
-                items_created += 1
+                    "iso_section": goal_data.get("iso_section", "15.5"),
+                }
+                for goal_data in agent_result.get("goals", [])
+            ]
+            session.bulk_insert_mappings(CybersecurityGoal, goal_mappings)
+            items_created = len(goal_mappings)
             
             session.commit()
         
@@ -663,6 +738,24 @@ class TaraProcessor:
             items_created=items_created
         )
     
+    def _asset_context(self, asset: Asset) -> Dict[str, Any]:
+        """Agent context describing an asset, shared by the steps that analyze assets.
+        
+        Assets are not modified during a run, so each is converted once and the
+        same dictionary is reused (agents treat their context as read-only).
+        """
+        context = self._asset_contexts.get(asset.id)
+        if context is None:
+            context = self._asset_contexts[asset.id] = {
+                "asset_name": asset.name,
+                "asset_type": asset.asset_type.value,
+                "criticality": asset.criticality_level.value,
+                "interfaces": asset.interfaces,
+                "data_flows": asset.data_flows,
+                "security_properties": asset.security_properties
+            }
+        return context
+    
     def _load_analysis(self, analysis_id: str) -> TaraAnalysis:
         """Load analysis from database with relationships."""
         with self.db_service.get_session() as session:
@@ -697,26 +790,32 @@ class TaraProcessor:
             
             return analysis
     
-    def _update_analysis_progress(self, analysis: TaraAnalysis, completed_step: TaraStep) -> None:
-        """Update analysis progress after step completion."""
-        with self.db_service.get_session() as session:
-            # Update the analysis in the session
-            analysis_in_session = session.merge(analysis)
-            
-            # Set current step
-            step_index = self.step_sequence.index(completed_step)
-            if step_index < len(self.step_sequence) - 1:
-                next_step = self.step_sequence[step_index + 1]
-                analysis_in_session.current_step = next_step.value
-            
-            session.commit()
+    def _update_analysis_progress(self, analysis: TaraAnalysis, steps_completed: List[TaraStep]) -> None:
+        """Update analysis progress after a layer of steps completes.
+        
+        The current step is the first step in sequence not completed yet, which
+        holds however the steps were grouped into layers. current_step is not a
+        mapped column (persisted progress is derived from the stored entities),
+        so it is tracked in memory; each step's handler already commits its own
+        results once at the step boundary.
+        """
+        completed = set(steps_completed)
+        next_step = next((step for step in self.step_sequence if step not in completed), None)
+        if next_step is not None:
+            analysis.current_step = next_step.value
     
-    def _finalize_analysis(self, analysis: TaraAnalysis) -> None:
+    def _finalize_analysis(self, analysis: TaraAnalysis, completed_at: datetime) -> None:
         """Mark analysis as completed."""
+        from sqlalchemy import update
+        
         with self.db_service.get_session() as session:
-            analysis_in_session = session.merge(analysis)
-            analysis_in_session.completion_status = CompletionStatus.COMPLETED
-            analysis_in_session.completed_at = datetime.now()
+            # Single UPDATE by primary key; merging the detached analysis would
+            # first reload it and cascade through its loaded relationships
+            session.execute(
+                update(TaraAnalysis)
+                .where(TaraAnalysis.id == analysis.id)
+                .values(completion_status=CompletionStatus.COMPLETED, completed_at=completed_at)
+            )
             session.commit()
     
     def _calculate_performance_metrics(
@@ -745,14 +844,29 @@ class TaraProcessor:
             Dictionary with current analysis status
         """
         try:
-            analysis = self._load_analysis(analysis_id)
+            with self.db_service.get_session() as session:
+                analysis = session.query(TaraAnalysis).filter(TaraAnalysis.id == analysis_id).first()
+                
+                # Finished analyses are at the final step; only load the
+                # entity tree when progress has to be derived from it
+                if analysis and analysis.completion_status not in _FINISHED_STATUSES:
+                    analysis = TaraAnalysis.get_for_report(session, analysis_id)
+            
+            if not analysis:
+                raise TaraProcessorError(f"Analysis not found: {analysis_id}")
+            
+            if analysis.completion_status in _FINISHED_STATUSES:
+                current_step = len(self.step_sequence)
+            else:
+                # Walk the analysis tree once and share the result
+                current_step = analysis.get_current_step()
             
             return {
                 "analysis_id": str(analysis.id),
                 "analysis_name": analysis.analysis_name,
                 "completion_status": analysis.completion_status.value,
-                "current_step": analysis.get_current_step(),
-                "progress_percentage": self._calculate_progress_percentage(analysis),
+                "current_step": current_step,
+                "progress_percentage": self._calculate_progress_percentage(analysis, current_step),
                 "created_at": analysis.created_at.isoformat(),
                 "completed_at": analysis.completed_at.isoformat() if analysis.completed_at else None
             }
@@ -763,21 +877,13 @@ class TaraProcessor:
                 "error": f"Status check failed: {e}"
             }
     
-    def _calculate_progress_percentage(self, analysis: TaraAnalysis) -> int:
-        """Calculate completion percentage for analysis."""
-        if analysis.completion_status == CompletionStatus.COMPLETED:
-            return 100
-        elif analysis.completion_status == CompletionStatus.FAILED:
-            return 0
-        
-        # Calculate based on current step
-        current_step = analysis.get_current_step()
-        if not current_step:
-            return 0
+    def _calculate_progress_percentage(
+        self, analysis: TaraAnalysis, current_step: Optional[int] = None
+    ) -> int:
+        """Calculate completion percentage for analysis.
         
-        try:
-            current_step_enum = TaraStep(current_step)
-            step_index = self.step_sequence.index(current_step_enum)
-            return int((step_index / len(self.step_sequence)) * 100)
-        except (ValueError, IndexError):
-            return 0
\ No newline at end of file
+        Args:
+            analysis: Analysis to evaluate
+            current_step: Result of analysis.get_current_step() if already known
+        """
+        return analysis.get_progress_percentage(current_step)
\ No newline at end of file
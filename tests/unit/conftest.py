@@ -0,0 +1,136 @@
+"""Shared fixtures for unit tests.
+
+Builds an in-memory SQLite schema and a minimal analysis graph so model and
+service helpers can be exercised without the CLI.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+from autogen_core.models import UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from autogt.models import (
+    Base, TaraAnalysis, Asset, ThreatScenario, AttackPath, AttackFeasibility,
+    ImpactRating, RiskValue, AnalysisPhase, AssetType, CriticalityLevel, ThreatActor,
+    SafetyImpact, FinancialImpact, OperationalImpact, PrivacyImpact,
+    ElapsedTime, SpecialistExpertise, KnowledgeOfTarget, WindowOfOpportunity, EquipmentRequired
+)
+
+_THREATS_RESPONSE = (
+    '{"threats": [{"name": "CAN injection", "actor": "CRIMINAL", "motivation": "Vehicle theft", '
+    '"attack_vectors": ["OBD-II"], "prerequisites": ["Physical access"]}]}'
+)
+
+
+class _RecordingModelClient(ReplayChatCompletionClient):
+    """Model client replaying a canned response and recording every request."""
+
+    def __init__(self, calls: int = 10):
+        super().__init__([_THREATS_RESPONSE] * calls)
+
+    async def create(self, messages, **kwargs):
+        # Yield first so concurrent requests interleave as they would over the network
+        await asyncio.sleep(0)
+        return await super().create(messages, **kwargs)
+
+    def user_prompts(self):
+        """User turns sent with each model call, by asset name."""
+        return [
+            [message.content.split("Asset Name: ")[1].splitlines()[0]
+             for message in call["messages"] if isinstance(message, UserMessage)]
+            for call in self.create_calls
+        ]
+
+
+@pytest.fixture
+def recording_model_client():
+    """Model client answering threat requests without network access."""
+    return _RecordingModelClient()
+
+
+@pytest.fixture
+def session():
+    """Session bound to a fresh in-memory database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def analysis(session):
+    """Persisted analysis with no assets."""
+    analysis = TaraAnalysis(
+        analysis_name="Unit Test Analysis",
+        vehicle_model="Test Vehicle",
+        analysis_phase=AnalysisPhase.DESIGN,
+    )
+    session.add(analysis)
+    session.commit()
+    return analysis
+
+
+@pytest.fixture
+def make_risk_value(session, analysis):
+    """Factory creating an asset with one fully rated threat scenario.
+
+    Returns the persisted RiskValue; its score and level are derived from the
+    given impact and feasibility scores.
+    """
+    def factory(impact_score: float = 0.5, feasibility_score: float = 0.5, name: str = "ECU"):
+        asset = Asset(
+            analysis_id=analysis.id,
+            name=name,
+            asset_type=AssetType.ECU,
+            criticality_level=CriticalityLevel.HIGH,
+            iso_section="15.3",
+        )
+        threat = ThreatScenario(
+            asset=asset,
+            threat_name=f"{name} spoofing",
+            threat_actor=ThreatActor.CRIMINAL,
+            motivation="Financial gain",
+            iso_section="15.4",
+        )
+        attack_path = AttackPath(threat_scenario=threat, step_sequence=1, attack_step="Access bus")
+        feasibility = AttackFeasibility(
+            attack_path=attack_path,
+            elapsed_time=ElapsedTime.DAYS,
+            specialist_expertise=SpecialistExpertise.PROFICIENT,
+            knowledge_of_target=KnowledgeOfTarget.RESTRICTED,
+            window_of_opportunity=WindowOfOpportunity.MODERATE,
+            equipment_required=EquipmentRequired.SPECIALIZED,
+            feasibility_score=feasibility_score,
+        )
+        impact = ImpactRating(
+            asset=asset,
+            safety_impact=SafetyImpact.MAJOR,
+            financial_impact=FinancialImpact.MAJOR,
+            operational_impact=OperationalImpact.MAJOR,
+            privacy_impact=PrivacyImpact.MODERATE,
+            impact_score=impact_score,
+            iso_section="15.5",
+        )
+        risk_value = RiskValue(
+            asset=asset,
+            threat_scenario=threat,
+            impact_rating=impact,
+            attack_feasibility=feasibility,
+            risk_score=0.0,
+        )
+        risk_value.update_calculated_values()
+        session.add_all([asset, risk_value])
+        session.commit()
+        return risk_value
+
+    return factory
@@ -0,0 +1,179 @@
+"""Unit tests for TaraAnalysis query, validation and progress helpers."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy import event
+
+from autogt.cli.commands import analysis as analysis_commands
+from autogt.cli.commands.analysis import _calculate_progress_percentage
+from autogt.models import TaraAnalysis, RiskLevel, CompletionStatus
+from autogt.services.tara_processor import TaraProcessor
+
+
+class TestRiskMetrics:
+    """Aggregated risk metrics of one analysis."""
+
+    def test_counts_and_average_per_level(self, session, analysis, make_risk_value):
+        make_risk_value(impact_score=0.5, feasibility_score=0.5, name="ECU")
+        make_risk_value(impact_score=0.5, feasibility_score=0.4, name="Gateway")
+        make_risk_value(impact_score=0.9, feasibility_score=1.0, name="Telematics")
+
+        metrics = TaraAnalysis.risk_metrics(session, analysis.id)
+
+        assert metrics["level_counts"] == {RiskLevel.LOW: 2, RiskLevel.VERY_HIGH: 1}
+        assert metrics["total_risks"] == 3
+        assert metrics["average_score"] == pytest.approx((0.25 + 0.2 + 0.9) / 3)
+
+    def test_excludes_other_analyses(self, session, analysis, make_risk_value):
+        make_risk_value()
+        other = TaraAnalysis(
+            analysis_name="Other Analysis", vehicle_model="Other", analysis_phase=analysis.analysis_phase
+        )
+        session.add(other)
+        session.commit()
+
+        metrics = TaraAnalysis.risk_metrics(session, other.id)
+
+        assert metrics == {"level_counts": {}, "total_risks": 0, "average_score": 0.0}
+
+
+class TestIterRiskValues:
+    """Chunked streaming of an analysis' risk values."""
+
+    def test_yields_every_risk_value_across_chunks(self, session, analysis, make_risk_value):
+        created = {make_risk_value(name=f"ECU {index}").id for index in range(5)}
+        session.expire_all()
+
+        streamed = [
+            risk_value.id
+            for risk_value in TaraAnalysis.iter_risk_values(session, analysis.id, chunk_size=2)
+        ]
+
+        assert len(streamed) == 5
+        assert set(streamed) == created
+
+    def test_relationships_load_lazily(self, session, analysis, make_risk_value):
+        make_risk_value(impact_score=0.8)
+        session.expire_all()
+
+        risk_value = next(TaraAnalysis.iter_risk_values(session, analysis.id))
+
+        assert "impact_rating" not in risk_value.__dict__
+        assert risk_value.impact_rating.impact_score == 0.8
+
+
+class TestValidateBatch:
+    """Validation rules evaluated for every analysis at once."""
+
+    def test_reports_only_failing_analyses(self, session, analysis):
+        invalid = TaraAnalysis(
+            analysis_name="Invalid Analysis",
+            vehicle_model="Test Vehicle",
+            analysis_phase=analysis.analysis_phase,
+            input_file_path="assets.pdf",
+            output_file_path="report.json",
+        )
+        session.add(invalid)
+        session.commit()
+
+        errors = TaraAnalysis.validate_batch(session)
+
+        assert list(errors) == [invalid.id]
+        assert errors[invalid.id] == invalid.validate()
+        assert len(errors[invalid.id]) == 2
+
+    def test_completed_analysis_is_valid(self, session, analysis):
+        analysis.output_file_path = "report.json"
+        analysis.mark_completed()
+        session.commit()
+
+        assert TaraAnalysis.validate_batch(session) == {}
+
+
+class TestGetForReport:
+    """Report loading plan covers everything progress calculation reads."""
+
+    def test_current_step_after_session_close(self, session, analysis, make_risk_value):
+        make_risk_value()
+        analysis_id = analysis.id
+        session.expunge_all()
+
+        report = TaraAnalysis.get_for_report(session, analysis_id)
+        session.close()
+
+        assert report.get_current_step() == 7
+
+
+class TestProgressPercentage:
+    """Progress derived from the first incomplete TARA step."""
+
+    def test_new_analysis_has_no_progress(self, analysis):
+        assert analysis.get_current_step() == 1
+        assert analysis.get_progress_percentage() == 0
+
+    def test_progress_counts_completed_steps(self, analysis, make_risk_value):
+        make_risk_value()
+
+        # Everything up to risk values exists; risk treatment is next
+        assert analysis.get_current_step() == 7
+        assert analysis.get_progress_percentage() == 75
+
+    def test_finished_statuses(self, analysis, make_risk_value):
+        make_risk_value()
+        analysis.mark_completed()
+        assert analysis.get_progress_percentage() == 100
+
+        analysis.mark_validated()
+        assert analysis.completion_status is CompletionStatus.VALIDATED
+        assert analysis.get_progress_percentage() == 100
+
+        analysis.completion_status = CompletionStatus.FAILED
+        assert analysis.get_progress_percentage() == 0
+
+    def test_cli_and_processor_agree(self, analysis, make_risk_value):
+        make_risk_value()
+        processor = TaraProcessor(Mock(), Mock(), Mock())
+
+        assert _calculate_progress_percentage(analysis) == 75
+        assert processor._calculate_progress_percentage(analysis) == 75
+
+
+class TestListCommand:
+    """Queries issued by `analysis list` do not grow with the entity tree."""
+
+    def _count_list_selects(self, monkeypatch, session) -> int:
+        db_service = MagicMock()
+        db_service.get_session.return_value.__enter__.return_value = session
+        monkeypatch.setattr(analysis_commands, "get_services", lambda ctx: (None, db_service))
+        session.expire_all()
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(session.bind, "before_cursor_execute", listener)
+        try:
+            result = CliRunner().invoke(
+                analysis_commands.list,
+                obj={"format_output": lambda data, fmt: str(data), "output_format": "json"},
+            )
+        finally:
+            event.remove(session.bind, "before_cursor_execute", listener)
+
+        assert result.exit_code == 0, result.output
+        return sum(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+
+    @pytest.mark.parametrize("status", [
+        CompletionStatus.IN_PROGRESS, CompletionStatus.COMPLETED,
+        CompletionStatus.VALIDATED, CompletionStatus.FAILED,
+    ])
+    def test_select_count_independent_of_asset_count(self, monkeypatch, session, analysis, make_risk_value, status):
+        analysis.completion_status = status
+        make_risk_value(name="ECU")
+        one_asset = self._count_list_selects(monkeypatch, session)
+
+        for index in range(3):
+            make_risk_value(name=f"Gateway {index}")
+        four_assets = self._count_list_selects(monkeypatch, session)
+
+        assert four_assets == one_asset
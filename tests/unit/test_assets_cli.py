@@ -0,0 +1,40 @@
+"""Unit tests for loading assets from files in the assets CLI command."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from autogt.cli.commands.assets import _load_assets_from_file
+from autogt.models import Asset, AnalysisPhase, TaraAnalysis
+from autogt.services.database import DatabaseService
+
+
+class TestLoadAssetsFromFile:
+    """Assets staged from a file are deduplicated by stripped name."""
+
+    def test_names_differing_in_whitespace_are_duplicates(self, tmp_path):
+        database_url = f"sqlite:///{tmp_path / 'autogt.db'}"
+        db_service = DatabaseService(database_url=database_url)
+        with db_service.get_session() as session:
+            analysis = TaraAnalysis(
+                analysis_name="Unit Test Analysis",
+                vehicle_model="Test Vehicle",
+                analysis_phase=AnalysisPhase.DESIGN,
+            )
+            session.add(analysis)
+            session.commit()
+            analysis_id = str(analysis.id)
+
+        assets_file = tmp_path / "assets.json"
+        assets_file.write_text(json.dumps([
+            {"name": "Engine ECU", "type": "HARDWARE"},
+            {"name": " Engine ECU ", "type": "HARDWARE"},
+            {"name": "   ", "type": "HARDWARE"},
+        ]))
+        config = Mock()
+        config.get_database_url.return_value = database_url
+
+        _load_assets_from_file(SimpleNamespace(obj={"config_instance": config}), analysis_id, str(assets_file))
+
+        with db_service.get_session() as session:
+            assert [name for (name,) in session.query(Asset.name)] == ["Engine ECU"]
@@ -0,0 +1,33 @@
+"""Unit tests for AttackFeasibility scoring."""
+
+from itertools import product
+
+import pytest
+from sqlalchemy import select
+
+from autogt.models import AttackFeasibility
+from autogt.models.attack_feasibility import _FEASIBILITY_FACTORS
+
+
+class TestDerivedFeasibilityScore:
+    """SQL expression of the derived score matches the Python calculation."""
+
+    def test_sql_matches_python_for_every_factor_combination(self, session, make_risk_value):
+        attack_path_id = make_risk_value().attack_feasibility.attack_path_id
+        columns = [column for column, _, _ in _FEASIBILITY_FACTORS]
+        feasibilities = [
+            AttackFeasibility(attack_path_id=attack_path_id, feasibility_score=0.0, **dict(zip(columns, factors)))
+            for factors in product(*(enum_cls for _, enum_cls, _ in _FEASIBILITY_FACTORS))
+        ]
+        session.add_all(feasibilities)
+        session.commit()
+
+        sql_scores = dict(session.execute(
+            select(AttackFeasibility.id, AttackFeasibility.derived_feasibility_score)
+        ).all())
+
+        assert len(feasibilities) == 5 * 4 * 4 * 4 * 4
+        for feasibility in feasibilities:
+            expected = feasibility.calculate_feasibility_score()
+            assert feasibility.derived_feasibility_score == expected
+            assert float(sql_scores[feasibility.id]) == pytest.approx(expected, abs=1e-9)
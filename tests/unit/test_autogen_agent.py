@@ -0,0 +1,126 @@
+"""Unit tests for AutoGenTaraAgent batching and response caching.
+
+Model round-trips are replaced with stubs or a replaying model client, so no
+API key or network access is needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from autogt.services.autogen_agent import AutoGenTaraAgent, TaraAgentError
+
+
+@pytest.fixture
+def agent():
+    """Agent configured with a dummy Gemini endpoint."""
+    return AutoGenTaraAgent(SimpleNamespace(
+        model_name="gemini-2.0-flash", api_key="test-key", base_url="https://example.invalid/v1"
+    ))
+
+
+@pytest.fixture
+def model_client(agent, recording_model_client):
+    """Recording client answering every model call of agent."""
+    agent.client = recording_model_client
+    return recording_model_client
+
+
+class TestBatch:
+    """Several agent operations awaited as one batch."""
+
+    def test_results_follow_call_order(self, agent, monkeypatch):
+        async def identify_threats(context):
+            # The first call finishes last, so order cannot come from completion
+            await asyncio.sleep(0.02 if context["asset_name"] == "ECU" else 0)
+            return {"threats": [context["asset_name"]]}
+
+        monkeypatch.setattr(agent, "identify_threats", identify_threats)
+
+        results = asyncio.run(agent.batch([
+            ("threats", {"asset_name": "ECU"}),
+            ("risk", {}),
+            ("threats", {"asset_name": "Gateway"}),
+        ]))
+
+        assert results == [
+            {"threats": ["ECU"]},
+            agent.calculate_risk({}),
+            {"threats": ["Gateway"]},
+        ]
+
+    def test_awaitable_operations_run_concurrently(self, agent, monkeypatch):
+        running = 0
+        peak = 0
+
+        async def identify_threats(context):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return {"threats": []}
+
+        monkeypatch.setattr(agent, "identify_threats", identify_threats)
+
+        asyncio.run(agent.batch([("threats", {}) for _ in range(3)]))
+
+        assert peak == 3
+
+    def test_unknown_operation_raises_before_any_call(self, agent, monkeypatch):
+        calls = []
+
+        async def identify_threats(context):
+            calls.append(context)
+            return {"threats": []}
+
+        monkeypatch.setattr(agent, "identify_threats", identify_threats)
+
+        with pytest.raises(TaraAgentError, match="controls"):
+            asyncio.run(agent.batch([("threats", {}), ("controls", {})]))
+        assert calls == []
+
+    def test_concurrent_threat_requests_do_not_share_context(self, agent, model_client):
+        asyncio.run(agent.batch([("threats", {"asset_name": f"Asset {index}"}) for index in range(3)]))
+
+        assert sorted(model_client.user_prompts()) == [["Asset 0"], ["Asset 1"], ["Asset 2"]]
+
+    def test_empty_batch(self, agent):
+        assert asyncio.run(agent.batch([])) == []
+
+
+class TestResponseCache:
+    """Reuse of AI threat responses for identical requests."""
+
+    def test_identical_request_is_served_from_cache(self, agent, model_client):
+        first = asyncio.run(agent.identify_threats({"asset_name": "ECU"}))
+        second = asyncio.run(agent.identify_threats({"asset_name": "ECU"}))
+        asyncio.run(agent.identify_threats({"asset_name": "Gateway"}))
+
+        assert first == second
+        assert len(model_client.create_calls) == 2
+
+    def test_callers_cannot_corrupt_cached_response(self, agent, model_client):
+        first = asyncio.run(agent.identify_threats({"asset_name": "ECU"}))
+        first["threats"][0]["attack_vectors"].append("Injected")
+        second = asyncio.run(agent.identify_threats({"asset_name": "ECU"}))
+        second["threats"].clear()
+        third = asyncio.run(agent.identify_threats({"asset_name": "ECU"}))
+
+        assert third["threats"][0]["attack_vectors"] == ["OBD-II"]
+        assert len(model_client.create_calls) == 1
+
+    def test_least_recently_used_entry_is_evicted(self, agent, model_client, monkeypatch):
+        monkeypatch.setattr("autogt.services.autogen_agent._RESPONSE_CACHE_SIZE", 2)
+
+        for asset_name in ("ECU", "Gateway", "ECU", "Telematics"):
+            asyncio.run(agent.identify_threats({"asset_name": asset_name}))
+        assert len(model_client.create_calls) == 3
+
+        # Gateway was least recently used when Telematics was added
+        asyncio.run(agent.identify_threats({"asset_name": "ECU"}))
+        assert len(model_client.create_calls) == 3
+        asyncio.run(agent.identify_threats({"asset_name": "Gateway"}))
+        assert len(model_client.create_calls) == 4
+        assert len(agent._response_cache) == 2
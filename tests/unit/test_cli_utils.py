@@ -0,0 +1,23 @@
+"""Unit tests for helpers shared by CLI commands."""
+
+import pytest
+
+from autogt.cli.utils import resolve_analysis_id
+from autogt.lib.exceptions import AutoGTError
+
+
+class TestResolveAnalysisId:
+    """Partial and full analysis IDs resolve to the stored analysis."""
+
+    def test_partial_id(self, session, analysis):
+        resolved = resolve_analysis_id(session, analysis.id.hex[:8])
+
+        assert str(resolved).replace('-', '') == analysis.id.hex
+
+    def test_full_id_with_and_without_dashes(self, session, analysis):
+        assert resolve_analysis_id(session, str(analysis.id)) == analysis.id
+        assert resolve_analysis_id(session, analysis.id.hex) == analysis.id
+
+    def test_unknown_partial_id_raises(self, session, analysis):
+        with pytest.raises(AutoGTError):
+            resolve_analysis_id(session, "zzzzzzzz")
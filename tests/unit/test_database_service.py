@@ -0,0 +1,40 @@
+"""Unit tests for database service query helpers."""
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from autogt.models import ThreatScenario
+from autogt.services.database import load_threat_scenarios
+
+
+class TestLoadThreatScenarios:
+    """Threat scenarios loaded with an explicit loading plan."""
+
+    def test_loads_scenarios_of_analysis_with_asset(self, session, analysis, make_risk_value):
+        make_risk_value(name="ECU")
+        make_risk_value(name="Gateway")
+        session.expire_all()
+
+        threat_scenarios = load_threat_scenarios(session, analysis.id)
+
+        assert sorted(threat.asset.name for threat in threat_scenarios) == ["ECU", "Gateway"]
+
+    def test_unrequested_relationships_raise(self, session, analysis, make_risk_value):
+        make_risk_value()
+        session.expire_all()
+
+        threat = load_threat_scenarios(session, analysis.id)[0]
+
+        with pytest.raises(InvalidRequestError):
+            threat.attack_paths
+
+    def test_requested_relationships_are_loaded(self, session, analysis, make_risk_value):
+        make_risk_value()
+        session.expire_all()
+
+        threat = load_threat_scenarios(
+            session, analysis.id, selectinload(ThreatScenario.attack_paths)
+        )[0]
+
+        assert [path.attack_step for path in threat.attack_paths] == ["Access bus"]
@@ -0,0 +1,79 @@
+"""Unit tests for RiskValue recalculation.
+
+Stored scores only change through explicit recalculation with
+bulk_update_calculated_values(), never implicitly on rating updates.
+"""
+
+import pytest
+
+from autogt.models import RiskValue, RiskLevel
+
+
+class TestRatingChanges:
+    """Rating score changes leave stored risk values alone."""
+
+    def test_stored_score_is_not_rewritten(self, session, make_risk_value):
+        # Scores written by `risks calculate` use the 1-16 product scale
+        risk_value = make_risk_value(impact_score=0.5, feasibility_score=0.5)
+        risk_value.risk_score = 3.6
+        risk_value.risk_level = RiskLevel.HIGH
+        session.commit()
+
+        risk_value.impact_rating.impact_score = 0.9
+        session.commit()
+        session.expire_all()
+
+        assert risk_value.risk_score == 3.6
+        assert risk_value.risk_level is RiskLevel.HIGH
+
+    def test_explicit_recalculation_after_rating_change(self, session, make_risk_value):
+        risk_value = make_risk_value(impact_score=0.5, feasibility_score=0.5)
+
+        risk_value.impact_rating.impact_score = 0.9
+        session.flush()
+        RiskValue.bulk_update_calculated_values(session, [risk_value.id])
+        session.commit()
+
+        assert risk_value.risk_score == pytest.approx(0.45)
+        assert risk_value.risk_level is RiskLevel.MEDIUM
+
+
+class TestBulkUpdateCalculatedValues:
+    """Batched recalculation of stale risk values."""
+
+    def test_recalculates_stale_values_across_batches(self, session, make_risk_value):
+        risk_values = [
+            make_risk_value(impact_score=0.9, feasibility_score=0.9, name=f"ECU {index}")
+            for index in range(3)
+        ]
+        # Simulate stale stored values
+        session.query(RiskValue).update({"risk_score": 0.0, "risk_level": RiskLevel.LOW})
+        session.commit()
+
+        updated = RiskValue.bulk_update_calculated_values(
+            session, [risk_value.id for risk_value in risk_values], batch_size=2
+        )
+        session.commit()
+        session.expire_all()
+
+        assert updated == 3
+        for risk_value in risk_values:
+            assert risk_value.risk_score == pytest.approx(0.81)
+            assert risk_value.risk_level is RiskLevel.VERY_HIGH
+
+    def test_only_listed_ids_are_updated(self, session, make_risk_value):
+        listed = make_risk_value(impact_score=0.9, feasibility_score=0.9, name="ECU")
+        unlisted = make_risk_value(impact_score=0.9, feasibility_score=0.9, name="Gateway")
+        session.query(RiskValue).update({"risk_score": 0.0, "risk_level": RiskLevel.LOW})
+        session.commit()
+
+        assert RiskValue.bulk_update_calculated_values(session, [listed.id]) == 1
+        session.commit()
+        session.expire_all()
+
+        assert listed.risk_level is RiskLevel.VERY_HIGH
+        assert unlisted.risk_score == 0.0
+        assert unlisted.risk_level is RiskLevel.LOW
+
+    def test_empty_ids(self, session):
+        assert RiskValue.bulk_update_calculated_values(session, []) == 0
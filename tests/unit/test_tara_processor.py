@@ -0,0 +1,170 @@
+"""Unit tests for TARA processor step orchestration."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from autogt.models import CompletionStatus
+from autogt.services.tara_processor import (
+    TaraProcessor, TaraProcessorConfig, TaraProcessorError, TaraStep, StepResult,
+    _dependency_layers
+)
+from autogt.services import tara_processor
+
+
+def _make_processor(dialect: str, failing_steps=(), enable_parallel_processing: bool = True):
+    """Processor whose steps only record their execution."""
+    db_service = Mock()
+    db_service.engine.dialect.name = dialect
+    processor = TaraProcessor(
+        db_service, Mock(), Mock(),
+        TaraProcessorConfig(enable_parallel_processing=enable_parallel_processing)
+    )
+    processor.executed = []
+    processor.threads = {}
+
+    def execute_step(analysis, step):
+        processor.executed.append(step)
+        processor.threads[step] = threading.current_thread()
+        success = step not in failing_steps
+        return StepResult(
+            step=step,
+            success=success,
+            execution_time_seconds=0.0,
+            items_processed=0,
+            items_created=0,
+            error_message=None if success else "boom",
+        )
+
+    processor._execute_step = execute_step
+    processor._load_analysis = Mock(return_value=SimpleNamespace(id="analysis-id"))
+    processor._finalize_analysis = Mock()
+    return processor
+
+
+class TestDependencyLayers:
+    """Grouping of steps into dependency layers."""
+
+    def test_layers_of_step_sequence(self):
+        processor = _make_processor("postgresql")
+
+        assert processor.step_layers == [
+            [TaraStep.ASSET_IDENTIFICATION],
+            [TaraStep.THREAT_SCENARIO_IDENTIFICATION, TaraStep.IMPACT_RATING],
+            [TaraStep.ATTACK_PATH_ANALYSIS],
+            [TaraStep.ATTACK_FEASIBILITY_RATING],
+            [TaraStep.RISK_VALUE_DETERMINATION],
+            [TaraStep.RISK_TREATMENT_DECISION],
+            [TaraStep.CYBERSECURITY_GOALS],
+        ]
+
+    def test_cyclic_dependencies_raise(self, monkeypatch):
+        monkeypatch.setitem(
+            tara_processor._STEP_DEPENDENCIES,
+            TaraStep.ASSET_IDENTIFICATION,
+            frozenset({TaraStep.CYBERSECURITY_GOALS}),
+        )
+
+        with pytest.raises(TaraProcessorError):
+            _dependency_layers(list(TaraStep))
+
+
+class TestProcessAnalysis:
+    """Execution order and failure handling of process_analysis()."""
+
+    @pytest.mark.parametrize("dialect, enable_parallel_processing", [
+        ("sqlite", True), ("postgresql", False),
+    ])
+    def test_sequential_runs_steps_in_sequence_order(self, dialect, enable_parallel_processing):
+        processor = _make_processor(dialect, enable_parallel_processing=enable_parallel_processing)
+
+        result = processor.process_analysis("analysis-id")
+
+        assert result.success
+        assert processor.executed == processor.step_sequence
+        assert result.steps_completed == processor.step_sequence
+        assert all(thread is threading.main_thread() for thread in processor.threads.values())
+
+    def test_parallel_runs_independent_steps_on_worker_threads(self):
+        processor = _make_processor("postgresql")
+
+        result = processor.process_analysis("analysis-id")
+
+        assert result.success
+        assert result.final_status is CompletionStatus.COMPLETED
+        assert [step_result.step for step_result in result.step_results] == [
+            step for layer in processor.step_layers for step in layer
+        ]
+        assert processor.threads[TaraStep.THREAT_SCENARIO_IDENTIFICATION] is not threading.main_thread()
+        assert processor.threads[TaraStep.IMPACT_RATING] is not threading.main_thread()
+        assert processor.threads[TaraStep.ASSET_IDENTIFICATION] is threading.main_thread()
+
+    def test_sequential_stops_at_first_failed_step(self):
+        processor = _make_processor("sqlite", failing_steps={TaraStep.THREAT_SCENARIO_IDENTIFICATION})
+
+        result = processor.process_analysis("analysis-id")
+
+        assert not result.success
+        assert result.final_status is CompletionStatus.FAILED
+        assert processor.executed == [
+            TaraStep.ASSET_IDENTIFICATION, TaraStep.THREAT_SCENARIO_IDENTIFICATION
+        ]
+        assert result.steps_completed == [TaraStep.ASSET_IDENTIFICATION]
+        processor._finalize_analysis.assert_not_called()
+
+    def test_parallel_stops_after_first_failed_layer(self):
+        processor = _make_processor("postgresql", failing_steps={TaraStep.THREAT_SCENARIO_IDENTIFICATION})
+
+        result = processor.process_analysis("analysis-id")
+
+        assert not result.success
+        assert TaraStep.THREAT_SCENARIO_IDENTIFICATION.value in result.error_message
+        # The failed step's layer completes, but no later layer starts
+        assert set(processor.executed) == {
+            TaraStep.ASSET_IDENTIFICATION, TaraStep.THREAT_SCENARIO_IDENTIFICATION, TaraStep.IMPACT_RATING
+        }
+        assert result.steps_completed == [TaraStep.ASSET_IDENTIFICATION, TaraStep.IMPACT_RATING]
+        processor._finalize_analysis.assert_not_called()
+
+    def test_progress_points_at_first_incomplete_step(self):
+        processor = _make_processor("postgresql", failing_steps={TaraStep.ATTACK_PATH_ANALYSIS})
+        analysis = processor._load_analysis.return_value
+
+        processor.process_analysis("analysis-id")
+
+        # Impact rating finished early, but attack path analysis is still pending
+        assert analysis.current_step == TaraStep.ATTACK_PATH_ANALYSIS.value
+
+
+class TestGetAnalysisStatus:
+    """Status report of a stored analysis."""
+
+    @pytest.fixture
+    def processor(self, session):
+        db_service = MagicMock()
+        db_service.get_session.return_value.__enter__.return_value = session
+        return TaraProcessor(db_service, Mock(), Mock())
+
+    @pytest.mark.parametrize("validate", [False, True])
+    def test_finished_analysis_is_at_final_step(self, processor, analysis, make_risk_value, validate):
+        make_risk_value()
+        analysis.output_file_path = "report.json"
+        analysis.mark_completed()
+        if validate:
+            analysis.mark_validated()
+
+        status = processor.get_analysis_status(analysis.id)
+
+        assert status["completion_status"] == analysis.completion_status.value
+        assert status["current_step"] == len(processor.step_sequence)
+        assert status["progress_percentage"] == 100
+
+    def test_in_progress_analysis_reports_current_step(self, processor, analysis, make_risk_value):
+        make_risk_value()
+
+        status = processor.get_analysis_status(analysis.id)
+
+        assert status["current_step"] == 7
+        assert status["progress_percentage"] == 75
@@ -0,0 +1,85 @@
+"""Unit tests for AI threat identification in the threats CLI command."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from autogt.cli.commands import threats
+from autogt.models import Asset, AssetType, CriticalityLevel
+from autogt.services.autogen_agent import AutoGenTaraAgent
+
+
+def _failing_agent(error: BaseException):
+    """Agent class whose threat identification always raises error."""
+    class FailingAgent:
+        def __init__(self, config):
+            pass
+
+        async def identify_threats(self, context, max_retries=3):
+            raise error
+
+    return FailingAgent
+
+
+def _make_asset(session, analysis, name: str = "ECU") -> Asset:
+    asset = Asset(
+        analysis_id=analysis.id,
+        name=name,
+        asset_type=AssetType.ECU,
+        criticality_level=CriticalityLevel.HIGH,
+        iso_section="15.3",
+    )
+    session.add(asset)
+    session.commit()
+    return asset
+
+
+@pytest.fixture
+def asset(session, analysis):
+    return _make_asset(session, analysis)
+
+
+@pytest.fixture
+def config():
+    config = Mock()
+    config.get_gemini_config.return_value = SimpleNamespace(
+        model_name="gemini-2.0-flash", api_key="test-key", base_url="https://example.invalid/v1"
+    )
+    return config
+
+
+class TestAiThreatIdentification:
+    """Per-asset failures returned by asyncio.gather()."""
+
+    def test_failed_asset_falls_back_to_rules(self, monkeypatch, session, analysis, asset, config):
+        monkeypatch.setattr(threats, "AutoGenTaraAgent", _failing_agent(RuntimeError("quota")))
+        fallback = Mock(return_value=2)
+        monkeypatch.setattr(threats, "_rule_based_threat_identification_for_asset", fallback)
+
+        assert threats._ai_threat_identification(session, analysis, [asset], config) == 2
+        fallback.assert_called_once_with(session, analysis, asset)
+
+    def test_cancellation_is_reraised(self, monkeypatch, session, analysis, asset, config):
+        monkeypatch.setattr(threats, "AutoGenTaraAgent", _failing_agent(asyncio.CancelledError()))
+        fallback = Mock(return_value=2)
+        monkeypatch.setattr(threats, "_rule_based_threat_identification_for_asset", fallback)
+
+        with pytest.raises(asyncio.CancelledError):
+            threats._ai_threat_identification(session, analysis, [asset], config)
+        fallback.assert_not_called()
+
+    def test_concurrent_requests_do_not_share_context(
+        self, monkeypatch, session, analysis, config, recording_model_client
+    ):
+        def make_agent(gemini_config):
+            agent = AutoGenTaraAgent(gemini_config)
+            agent.client = recording_model_client
+            return agent
+
+        monkeypatch.setattr(threats, "AutoGenTaraAgent", make_agent)
+        assets = [_make_asset(session, analysis, f"Asset {index}") for index in range(3)]
+
+        assert threats._ai_threat_identification(session, analysis, assets, config) == 3
+        assert sorted(recording_model_client.user_prompts()) == [["Asset 0"], ["Asset 1"], ["Asset 2"]]
@@ -0,0 +1,45 @@
+"""Unit tests for RiskTreatment validation."""
+
+from autogt.models import RiskTreatment, RiskLevel, TreatmentDecision, ResidualRiskLevel
+
+
+def _make_treatment(risk_value, residual_risk_level, original_risk_level=None) -> RiskTreatment:
+    return RiskTreatment(
+        risk_value=risk_value,
+        treatment_decision=TreatmentDecision.REDUCE,
+        residual_risk_level=residual_risk_level,
+        original_risk_level=original_risk_level,
+        countermeasures=["Message authentication"],
+        implementation_cost=1.0,
+        rationale="Implement controls to reduce the risk",
+        iso_section="15.11",
+    )
+
+
+class TestValidateResidualRiskLevel:
+    """Residual risk compared against the risk level when the decision was made."""
+
+    def test_uses_recorded_original_level(self, make_risk_value):
+        risk_value = make_risk_value(impact_score=0.5, feasibility_score=0.5)
+        assert risk_value.risk_level is RiskLevel.LOW
+
+        treatment = _make_treatment(risk_value, ResidualRiskLevel.MEDIUM, RiskLevel.HIGH)
+
+        assert treatment.validate_residual_risk_level()
+
+    def test_falls_back_to_risk_value_level(self, session, make_risk_value):
+        risk_value = make_risk_value(impact_score=0.5, feasibility_score=0.5)
+        treatment = _make_treatment(risk_value, ResidualRiskLevel.MEDIUM)
+        session.add(treatment)
+        session.commit()
+
+        assert treatment.original_risk_level is None
+        assert not treatment.validate_residual_risk_level()
+
+        treatment.residual_risk_level = ResidualRiskLevel.LOW
+        assert treatment.validate_residual_risk_level()
+
+    def test_without_any_level_is_invalid(self):
+        treatment = _make_treatment(None, ResidualRiskLevel.LOW)
+
+        assert not treatment.validate_residual_risk_level()